@@ -113,8 +113,8 @@ mod tests {
     fn make_turns(n: usize) -> Vec<ConversationTurn> {
         (0..n)
             .map(|i| ConversationTurn {
-                user: format!("user message {i}"),
-                assistant: format!("assistant reply {i}"),
+                user: format!("user message {i}").into(),
+                assistant: format!("assistant reply {i}").into(),
             })
             .collect()
     }
@@ -445,25 +445,25 @@ impl ToolExecutor {
         .await
         .map_err(|_| anyhow::anyhow!("command timed out after {}s", timeout_secs))??;
 
-        let stdout = String::from_utf8_lossy(&output_result.stdout);
-        let stderr = String::from_utf8_lossy(&output_result.stderr);
-        let combined = if stderr.is_empty() {
-            stdout.to_string()
-        } else {
-            format!("{stdout}\n[stderr] {stderr}")
-        };
+        // Take ownership of stdout: valid UTF-8 (the common case) becomes the
+        // output String without a copy; only invalid bytes go the lossy route.
+        let mut combined = String::from_utf8(output_result.stdout)
+            .unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned());
+        if !output_result.stderr.is_empty() {
+            combined.push_str("\n[stderr] ");
+            combined.push_str(&String::from_utf8_lossy(&output_result.stderr));
+        }
         let max_output = 32768;
-        let result = if combined.len() > max_output {
+        if combined.len() > max_output {
             let mut end = max_output;
             while end > 0 && !combined.is_char_boundary(end) { end -= 1; }
-            format!("{}…[truncated]", &combined[..end])
-        } else {
-            combined
-        };
+            combined.truncate(end);
+            combined.push_str("…[truncated]");
+        }
 
         Ok(aigent_tools::ToolOutput {
             success: output_result.status.success(),
-            output: result,
+            output: combined,
         })
     }
 
@@ -338,33 +338,49 @@ fn resolve_bindings(
     args: &HashMap<String, String>,
     bindings: &HashMap<String, String>,
 ) -> HashMap<String, String> {
-    use std::sync::LazyLock;
-    static PLACEHOLDER_RE: LazyLock<regex::Regex> =
-        LazyLock::new(|| regex::Regex::new(r"\{\{([^}]+)\}\}").unwrap());
-
     args.iter()
-        .map(|(k, v)| {
-            let resolved = PLACEHOLDER_RE
-                .replace_all(v, |caps: &regex::Captures<'_>| {
-                    let key = &caps[1];
-                    bindings.get(key).cloned().unwrap_or_else(|| {
-                        // Try stripping "input." prefix.
-                        if let Some(bare) = key.strip_prefix("input.") {
-                            bindings
-                                .get(bare)
-                                .cloned()
-                                .unwrap_or_else(|| format!("{{{{{key}}}}}"))
-                        } else {
-                            format!("{{{{{key}}}}}")
-                        }
-                    })
-                })
-                .to_string();
-            (k.clone(), resolved)
-        })
+        .map(|(k, v)| (k.clone(), substitute_placeholders(v, bindings)))
         .collect()
 }
 
+/// Substitute every `{{key}}` (key = one or more non-`}` chars) in `value`.
+///
+/// A plain `find` scan over the literal `{{` / `}}` delimiters — the same
+/// matches as the regex `\{\{([^}]+)\}\}`, without a regex engine.
+/// Unknown keys are left in place verbatim.
+fn substitute_placeholders(value: &str, bindings: &HashMap<String, String>) -> String {
+    let mut out = String::with_capacity(value.len());
+    let mut rest = value;
+    while let Some(open) = rest.find("{{") {
+        let after = &rest[open + 2..];
+        let key_len = after.find('}').unwrap_or(after.len());
+        if key_len == 0 || !after[key_len..].starts_with("}}") {
+            // Not a placeholder here; resume the search one byte later
+            // (`{` is ASCII, so this stays on a char boundary).
+            out.push_str(&rest[..open + 1]);
+            rest = &rest[open + 1..];
+            continue;
+        }
+        out.push_str(&rest[..open]);
+        let key = &after[..key_len];
+        // Try the key as-is, then with an "input." prefix stripped.
+        let bound = bindings.get(key).or_else(|| {
+            key.strip_prefix("input.").and_then(|bare| bindings.get(bare))
+        });
+        match bound {
+            Some(bound) => out.push_str(bound),
+            None => {
+                out.push_str("{{");
+                out.push_str(key);
+                out.push_str("}}");
+            }
+        }
+        rest = &after[key_len + 2..];
+    }
+    out.push_str(rest);
+    out
+}
+
 // ── Tests ────────────────────────────────────────────────────────────────────
 
 #[cfg(test)]
@@ -407,6 +423,22 @@ mod tests {
         assert_eq!(resolved["path"], "{{nonexistent}}");
     }
 
+    #[test]
+    fn resolve_bindings_embedded_and_malformed() {
+        let mut args = HashMap::new();
+        args.insert("cmd".to_string(), "cat {{a}} > {{b}}.out {{}} {{a".to_string());
+        args.insert("brace".to_string(), "{{{a}}".to_string());
+
+        let mut bindings = HashMap::new();
+        bindings.insert("a".to_string(), "in.txt".to_string());
+        bindings.insert("b".to_string(), "result".to_string());
+
+        let resolved = resolve_bindings(&args, &bindings);
+        assert_eq!(resolved["cmd"], "cat in.txt > result.out {{}} {{a");
+        // Matches the old regex: the key is "{a", which is unbound.
+        assert_eq!(resolved["brace"], "{{{a}}");
+    }
+
     #[test]
     fn chain_step_deserialization() {
         let json = r#"{
@@ -120,7 +120,7 @@ impl App {
         #[cfg(feature = "advanced")]
         { self.vim_input.text() }
         #[cfg(not(feature = "advanced"))]
-        { self.input.text() }
+        { self.input.text().to_string() }
     }
 
     pub fn clear_input(&mut self) {
@@ -167,7 +167,7 @@ impl App {
                 self.status_bar.spinner_tick =
                     self.status_bar.spinner_tick.wrapping_add(1);
                 // Refresh file picker on tick so it reacts to typing.
-                self.file_picker.refresh(&self.input.text());
+                self.file_picker.refresh(self.input.text());
                 None
             }
             AppEvent::Backend(be) => {
@@ -287,7 +287,7 @@ impl App {
                         .get(self.command_palette.state.selected)
                     {
                         self.input.clear();
-                        self.input.textarea.insert_str(cmd);
+                        self.input.insert_str(cmd);
                         self.command_palette.state.visible = false;
                     }
                 }
@@ -331,9 +331,9 @@ impl App {
                         .cloned()
                     {
                         let updated =
-                            replace_last_at_token(&self.input.text(), &path);
+                            replace_last_at_token(self.input.text(), &path);
                         self.input.clear();
-                        self.input.textarea.insert_str(&updated);
+                        self.input.insert_str(&updated);
                         self.file_picker.state.visible = false;
                     }
                     return None;
@@ -483,7 +483,7 @@ impl App {
             }
             _ => {
                 // Forward to textarea.
-                self.input.textarea.input(Input {
+                let changed = self.input.input(Input {
                     key: match key.code {
                         KeyCode::Char(c) => Key::Char(c),
                         KeyCode::Enter => Key::Enter,
@@ -505,9 +505,11 @@ impl App {
                     shift: key.modifiers.contains(KeyModifiers::SHIFT),
                 });
                 // Soft-wrap and refresh file picker after input change.
-                self.input.wrap_width = 60; // Will be updated in draw().
-                self.input.apply_soft_wrap();
-                self.file_picker.refresh(&self.input.text());
+                if changed {
+                    self.input.wrap_width = 60; // Will be updated in draw().
+                    self.input.apply_soft_wrap();
+                    self.file_picker.refresh(self.input.text());
+                }
                 None
             }
         }
@@ -523,8 +525,9 @@ impl App {
                     if last.role == "assistant"
                         && last.content.starts_with("[stream]")
                     {
-                        last.content =
-                            format!("[stream]{}", self.pending_stream);
+                        // Append just the new chunk; re-formatting the whole
+                        // stream on every token is quadratic in reply length.
+                        last.content.push_str(&chunk);
                         self.chat.auto_follow = true;
                         return;
                     }
@@ -756,7 +759,7 @@ impl App {
             self.input.wrap_width =
                 usize::from(frame.area().width.saturating_sub(4)).max(8);
             self.input.apply_soft_wrap();
-            let input_line_count = self.input.textarea.lines().len().max(1);
+            let input_line_count = self.input.line_count().max(1);
             (input_line_count as u16 + 2).clamp(3, 8)
         };
 
@@ -4,14 +4,19 @@ use ratatui::layout::Rect;
 use ratatui::style::Style;
 use ratatui::widgets::{Block, BorderType, Borders};
 use ratatui::Frame;
-use tui_textarea::TextArea;
+use tui_textarea::{Input, TextArea};
 
 use crate::theme::Theme;
 
 /// The multi-line input bar at the bottom of the TUI.
+///
+/// All edits go through `InputBar` methods so the joined text can be cached:
+/// the file picker reads it on every tick and key press.
 pub struct InputBar {
-    pub textarea: TextArea<'static>,
+    textarea: TextArea<'static>,
     pub wrap_width: usize,
+    /// `textarea` lines joined with `\n`; rebuilt only when content changes.
+    text: String,
 }
 
 impl Default for InputBar {
@@ -27,25 +32,57 @@ impl InputBar {
         Self {
             textarea,
             wrap_width: 60,
+            text: String::new(),
         }
     }
 
     /// Current text content (all lines joined).
-    pub fn text(&self) -> String {
-        self.textarea.lines().join("\n")
+    pub fn text(&self) -> &str {
+        &self.text
+    }
+
+    /// Number of lines in the text area (at least 1).
+    pub fn line_count(&self) -> usize {
+        self.textarea.lines().len()
+    }
+
+    /// Insert `s` at the cursor.
+    pub fn insert_str(&mut self, s: &str) {
+        self.textarea.insert_str(s);
+        self.sync_text();
+    }
+
+    /// Forward a key to the text area.  Returns `true` if the content changed.
+    pub fn input(&mut self, input: impl Into<Input>) -> bool {
+        let changed = self.textarea.input(input);
+        if changed {
+            self.sync_text();
+        }
+        changed
     }
 
     /// Reset the text area to empty.
     pub fn clear(&mut self) {
         self.textarea = TextArea::default();
         self.textarea.set_cursor_line_style(Default::default());
+        self.text.clear();
+    }
+
+    /// Rebuild the cached joined text from the text area, reusing its buffer.
+    fn sync_text(&mut self) {
+        self.text.clear();
+        for (i, line) in self.textarea.lines().iter().enumerate() {
+            if i > 0 {
+                self.text.push('\n');
+            }
+            self.text.push_str(line);
+        }
     }
 
     /// Apply soft-wrapping to the input text at the given width.
     pub fn apply_soft_wrap(&mut self) {
-        let raw = self.text();
-        let wrapped = soft_wrap_text(&raw, self.wrap_width);
-        if wrapped != raw {
+        let wrapped = soft_wrap_text(&self.text, self.wrap_width);
+        if wrapped != self.text {
             let cursor = self.textarea.cursor();
             self.textarea = TextArea::default();
             self.textarea.set_cursor_line_style(Default::default());
@@ -57,6 +94,7 @@ impl InputBar {
             for _ in 0..target_line {
                 self.textarea.move_cursor(tui_textarea::CursorMove::Down);
             }
+            self.sync_text();
         }
     }
 
@@ -162,3 +200,34 @@ fn split_hard(input: &str, width: usize) -> Vec<String> {
     }
     chunks
 }
+
+// ── Tests ────────────────────────────────────────────────────────────────────
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn cached_text_tracks_edits() {
+        let mut bar = InputBar::new();
+        assert_eq!(bar.text(), "");
+        bar.insert_str("hello\nworld");
+        assert_eq!(bar.text(), "hello\nworld");
+        assert_eq!(bar.line_count(), 2);
+        assert!(bar.input(Input { key: tui_textarea::Key::Backspace, ..Default::default() }));
+        assert_eq!(bar.text(), "hello\nworl");
+        assert!(!bar.input(Input { key: tui_textarea::Key::Left, ..Default::default() }));
+        bar.clear();
+        assert_eq!(bar.text(), "");
+    }
+
+    #[test]
+    fn soft_wrap_keeps_cache_in_sync() {
+        let mut bar = InputBar::new();
+        bar.wrap_width = 10;
+        bar.insert_str("one two three four");
+        bar.apply_soft_wrap();
+        assert_eq!(bar.text(), bar.textarea.lines().join("\n"));
+        assert!(bar.line_count() > 1);
+    }
+}
@@ -0,0 +1,257 @@
+//! Streaming responses as a `Stream` of events.
+//!
+//! A streaming call returns a [`ChatStream`]: batched text tokens as they
+//! arrive, then a single [`ChatStreamEvent::Done`] carrying the full
+//! [`ChatResponse`].  The caller drives it directly — collect it, forward
+//! it to a UI channel with [`forward_chat_stream`], or drop it to cancel —
+//! so no channel or consumer task is needed just to make the call.
+//!
+//! The provider-specific part is a [`StreamDecoder`], which turns one body
+//! line into an optional text token.  [`decode_stream`] does the rest: line
+//! splitting ([`LineBuffer`]), token batching ([`TokenBatcher`]) and
+//! assembling the final response.
+
+use anyhow::Result;
+use futures::stream::BoxStream;
+use futures::{Stream, StreamExt};
+use tokio::sync::mpsc;
+
+use crate::line_buffer::LineBuffer;
+use crate::token_batch::{Next, TokenBatcher};
+use crate::{ChatResponse, ModelProvider, ToolCall};
+
+/// One item of a [`ChatStream`].
+#[derive(Debug, Clone)]
+pub enum ChatStreamEvent {
+    /// A batch of streamed text, in order.
+    Token(String),
+    /// The complete response.  Always the last event of a successful stream;
+    /// its `content` is the concatenation of every preceding token.
+    Done(ChatResponse),
+}
+
+/// Stream returned by the streaming chat and completion calls.
+///
+/// A transport error ends the stream after yielding `Err`, without a
+/// [`ChatStreamEvent::Done`].
+pub type ChatStream = BoxStream<'static, Result<ChatStreamEvent>>;
+
+/// Drive `stream` to completion, sending each token batch on `tx`.
+///
+/// For consumers that take tokens over a channel (e.g. the TUI).  Returns
+/// the final response.  A closed channel does not stop the stream, so the
+/// full response is still returned if the receiver goes away mid-reply.
+pub async fn forward_chat_stream(
+    mut stream: ChatStream,
+    tx: &mpsc::Sender<String>,
+) -> Result<ChatResponse> {
+    while let Some(event) = stream.next().await {
+        match event? {
+            ChatStreamEvent::Token(text) => send_token(tx, text).await,
+            ChatStreamEvent::Done(response) => return Ok(response),
+        }
+    }
+    anyhow::bail!("chat stream ended without a response")
+}
+
+/// Forward one batch of streamed text to `tx`.
+///
+/// `try_send` completes without yielding to the scheduler whenever the
+/// channel has room, which is the steady state for a consumer that keeps up.
+/// Only a full channel falls back to `send().await`, so backpressure is kept.
+/// A closed channel (receiver dropped) is ignored, as before.
+async fn send_token(tx: &mpsc::Sender<String>, token: String) {
+    if let Err(mpsc::error::TrySendError::Full(token)) = tx.try_send(token) {
+        let _ = tx.send(token).await;
+    }
+}
+
+/// A stream whose response is already known: optionally `token` as a single
+/// batch, then `response`.
+pub(crate) fn ready_stream(token: Option<String>, response: ChatResponse) -> ChatStream {
+    let events = token
+        .map(ChatStreamEvent::Token)
+        .into_iter()
+        .chain([ChatStreamEvent::Done(response)])
+        .map(Ok);
+    futures::stream::iter(events).boxed()
+}
+
+// ── Decoding ───────────────────────────────────────────────────────────────────
+
+/// Provider-specific interpretation of a streamed response body.
+pub(crate) trait StreamDecoder: Send + 'static {
+    /// Decode one non-empty, trimmed body line, returning its text if any.
+    fn decode_line(&mut self, line: &[u8]) -> Option<String>;
+
+    /// Tool calls and finish reason, once the body has ended.
+    fn finish(self) -> (Vec<ToolCall>, String);
+}
+
+struct DecodeState<B, D> {
+    provider: ModelProvider,
+    body: B,
+    lines: LineBuffer,
+    batch: TokenBatcher,
+    content: String,
+    /// Taken when the final response is built.
+    decoder: Option<D>,
+    /// Set once the body has ended and its tail has been fed in.
+    eof: bool,
+}
+
+/// Turn a response body into a [`ChatStream`] using `decoder`.
+///
+/// Decoding runs only when the consumer asks for the next event.  The body
+/// itself may read ahead: for HTTP responses it is fed by the reader task
+/// in `body_stream`, which buffers up to 32 chunks before a slow consumer
+/// holds it back.
+pub(crate) fn decode_stream<B, E, D>(provider: ModelProvider, body: B, decoder: D) -> ChatStream
+where
+    B: Stream<Item = Result<bytes::Bytes, E>> + Send + Unpin + 'static,
+    E: std::error::Error + Send + Sync + 'static,
+    D: StreamDecoder,
+{
+    let state = DecodeState {
+        provider,
+        body,
+        lines: LineBuffer::new(),
+        batch: TokenBatcher::new(),
+        content: String::new(),
+        decoder: Some(decoder),
+        eof: false,
+    };
+    futures::stream::try_unfold(state, |mut state| async move {
+        loop {
+            let Some(decoder) = state.decoder.as_mut() else {
+                return Ok(None);
+            };
+            while let Some(line) = state.lines.next_line() {
+                if line.is_empty() {
+                    continue;
+                }
+                if let Some(text) = decoder.decode_line(line) {
+                    state.content.push_str(&text);
+                    if let Some(batch) = state.batch.push(text) {
+                        return Ok(Some((ChatStreamEvent::Token(batch), state)));
+                    }
+                }
+            }
+            if state.eof {
+                if let Some(batch) = state.batch.take() {
+                    return Ok(Some((ChatStreamEvent::Token(batch), state)));
+                }
+                let Some(decoder) = state.decoder.take() else {
+                    return Ok(None);
+                };
+                let (tool_calls, finish_reason) = decoder.finish();
+                let response = ChatResponse {
+                    provider: state.provider,
+                    content: std::mem::take(&mut state.content),
+                    tool_calls,
+                    finish_reason,
+                };
+                return Ok(Some((ChatStreamEvent::Done(response), state)));
+            }
+            match state.batch.next_chunk(&mut state.body).await {
+                Next::Due => {
+                    if let Some(batch) = state.batch.take() {
+                        return Ok(Some((ChatStreamEvent::Token(batch), state)));
+                    }
+                }
+                Next::Chunk(Some(chunk)) => {
+                    state.lines.feed(Some(&chunk?));
+                }
+                Next::Chunk(None) => {
+                    state.lines.feed(None);
+                    state.eof = true;
+                }
+            }
+        }
+    })
+    .boxed()
+}
+
+// ── Tests ──────────────────────────────────────────────────────────────────────
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Every line is a token; the finish reason counts the lines.
+    struct EchoLines(usize);
+
+    impl StreamDecoder for EchoLines {
+        fn decode_line(&mut self, line: &[u8]) -> Option<String> {
+            self.0 += 1;
+            Some(String::from_utf8_lossy(line).into_owned())
+        }
+
+        fn finish(self) -> (Vec<ToolCall>, String) {
+            (vec![], format!("lines={}", self.0))
+        }
+    }
+
+    fn body(
+        chunks: &[&'static str],
+    ) -> impl Stream<Item = Result<bytes::Bytes, std::io::Error>> + Send + Unpin + 'static {
+        let chunks: Vec<_> = chunks
+            .iter()
+            .map(|chunk| Ok(bytes::Bytes::from_static(chunk.as_bytes())))
+            .collect();
+        futures::stream::iter(chunks)
+    }
+
+    #[tokio::test]
+    async fn decodes_tokens_then_full_response() {
+        let stream = decode_stream(ModelProvider::Ollama, body(&["ab\ncd", "\n\nef"]), EchoLines(0));
+        let events: Vec<_> = stream.collect().await;
+        let mut tokens = String::new();
+        let mut done = None;
+        for event in events {
+            match event.unwrap() {
+                ChatStreamEvent::Token(text) => tokens.push_str(&text),
+                ChatStreamEvent::Done(response) => done = Some(response),
+            }
+        }
+        let done = done.expect("stream ends with Done");
+        assert_eq!(tokens, "abcdef");
+        assert_eq!(done.content, "abcdef");
+        assert_eq!(done.finish_reason, "lines=3");
+        assert_eq!(done.provider, ModelProvider::Ollama);
+    }
+
+    #[tokio::test]
+    async fn transport_error_ends_stream_without_done() {
+        let chunks = vec![
+            Ok(bytes::Bytes::from_static(b"ab\n")),
+            Err(std::io::Error::other("reset")),
+        ];
+        let mut stream = decode_stream(ModelProvider::OpenRouter, futures::stream::iter(chunks), EchoLines(0));
+        let mut saw_error = false;
+        while let Some(event) = stream.next().await {
+            match event {
+                Ok(ChatStreamEvent::Done(_)) => panic!("no Done after an error"),
+                Ok(ChatStreamEvent::Token(_)) => {}
+                Err(_) => saw_error = true,
+            }
+        }
+        assert!(saw_error);
+    }
+
+    #[tokio::test]
+    async fn forward_sends_tokens_and_returns_response() {
+        let (tx, mut rx) = mpsc::channel(8);
+        let response = ChatResponse {
+            provider: ModelProvider::Ollama,
+            content: "hi".to_string(),
+            tool_calls: vec![],
+            finish_reason: "stop".to_string(),
+        };
+        let done = forward_chat_stream(ready_stream(Some("hi".to_string()), response), &tx)
+            .await
+            .unwrap();
+        assert_eq!(done.content, "hi");
+        assert_eq!(rx.try_recv().unwrap(), "hi");
+    }
+}
@@ -1,5 +1,6 @@
 use anyhow::Result;
 use async_trait::async_trait;
+use futures::Stream;
 use serde::{Deserialize, Serialize};
 use serde_json::json;
 use std::collections::HashMap;
@@ -9,6 +10,12 @@ use tokio::sync::mpsc;
 
 #[cfg(feature = "candle")]
 pub mod candle_backend;
+mod chat_stream;
+mod line_buffer;
+mod token_batch;
+
+pub use chat_stream::{forward_chat_stream, ChatStream, ChatStreamEvent};
+use chat_stream::{decode_stream, ready_stream, StreamDecoder};
 
 // ── Chat message types for structured tool calling ───────────────────────────
 
@@ -97,8 +104,8 @@ pub struct ToolCallFunction {
 /// Response from a structured chat call.
 #[derive(Debug, Clone)]
 pub struct ChatResponse {
-    /// The provider that actually handled the request.
-    pub provider: Provider,
+    /// The backend that actually handled the request.
+    pub provider: ModelProvider,
     /// Text content of the assistant's response (may be empty if tool_calls present).
     pub content: String,
     /// Tool calls the assistant wants to make (empty if a normal text response).
@@ -120,10 +127,44 @@ pub struct OpenRouterClient {
     client: reqwest::Client,
 }
 
+// ── HTTP clients ─────────────────────────────────────────────────────────────
+//
+// Each provider keeps one long-lived client so its connection pool stays
+// warm across turns.  The settings differ because the links do: Ollama is a
+// plain-HTTP hop on localhost, OpenRouter a TLS connection over the WAN.
+
+/// HTTP client for the local Ollama server.
+///
+/// Nagle is disabled so small request bodies and the first streamed bytes
+/// are not held back waiting for ACKs — a pure time-to-first-token win on
+/// loopback, where there is nothing to gain from coalescing segments.
+fn ollama_http_client() -> reqwest::Client {
+    reqwest::Client::builder()
+        .pool_idle_timeout(Duration::from_secs(60))
+        .tcp_nodelay(true)
+        .build()
+        .unwrap_or_else(|_| reqwest::Client::new())
+}
+
+/// HTTP client for OpenRouter.
+///
+/// A long idle timeout plus TCP keep-alive lets consecutive turns reuse one
+/// TLS connection instead of paying a fresh handshake (~2 RTTs) each time.
+fn openrouter_http_client() -> reqwest::Client {
+    reqwest::Client::builder()
+        .use_rustls_tls()
+        .pool_max_idle_per_host(4)
+        .pool_idle_timeout(Duration::from_secs(300))
+        .tcp_keepalive(Duration::from_secs(30))
+        .tcp_nodelay(true)
+        .build()
+        .unwrap_or_else(|_| reqwest::Client::new())
+}
+
 impl OllamaClient {
     pub fn new() -> Self {
         Self {
-            client: reqwest::Client::new(),
+            client: ollama_http_client(),
             suppress_thinking: false,
         }
     }
@@ -138,7 +179,7 @@ impl Default for OllamaClient {
 impl OpenRouterClient {
     pub fn new() -> Self {
         Self {
-            client: reqwest::Client::new(),
+            client: openrouter_http_client(),
         }
     }
 }
@@ -228,14 +269,13 @@ pub trait LlmClient: Send + Sync {
         prompt: &str,
     ) -> Result<(ModelProvider, String)>;
 
-    /// Streaming text completion — tokens arrive on `tx`.
+    /// Streaming text completion — batched tokens, then the full response.
     async fn complete_stream(
         &self,
         provider: ModelProvider,
         model: &str,
         prompt: &str,
-        tx: mpsc::Sender<String>,
-    ) -> Result<(ModelProvider, String)>;
+    ) -> Result<ChatStream>;
 
     /// Structured chat with optional tool definitions (native calling).
     async fn chat(
@@ -246,15 +286,15 @@ pub trait LlmClient: Send + Sync {
         tools: Option<&serde_json::Value>,
     ) -> Result<ChatResponse>;
 
-    /// Streaming structured chat — content tokens arrive on `tx`.
+    /// Streaming structured chat — batched content tokens, then the full
+    /// response including any tool calls.
     async fn chat_stream(
         &self,
         provider: ModelProvider,
         model: &str,
         messages: &[ChatMessage],
         tools: Option<&serde_json::Value>,
-        tx: mpsc::Sender<String>,
-    ) -> Result<ChatResponse>;
+    ) -> Result<ChatStream>;
 }
 
 #[derive(Default)]
@@ -428,6 +468,29 @@ pub async fn list_openrouter_models() -> Result<Vec<String>> {
     Ok(models)
 }
 
+/// Whether `prompt` contains the `/fallback` marker (ASCII case-insensitive).
+///
+/// Prompts carry the full memory context, so this scans for `/` with memchr
+/// and compares in place rather than lowercasing a copy of the whole prompt.
+fn requests_fallback(prompt: &str) -> bool {
+    const MARKER: &[u8] = b"/fallback";
+    let bytes = prompt.as_bytes();
+    memchr::memchr_iter(b'/', bytes).any(|i| {
+        bytes
+            .get(i..i + MARKER.len())
+            .is_some_and(|candidate| candidate.eq_ignore_ascii_case(MARKER))
+    })
+}
+
+/// The provider that actually serves `prompt`: an Ollama request carrying
+/// the `/fallback` marker is rerouted to OpenRouter.
+fn effective_provider(primary: Provider, prompt: &str) -> Provider {
+    match primary {
+        Provider::Ollama if requests_fallback(prompt) => Provider::OpenRouter,
+        provider => provider,
+    }
+}
+
 impl LlmRouter {
     pub async fn chat_with_fallback(
         &self,
@@ -436,22 +499,12 @@ impl LlmRouter {
         openrouter_model: &str,
         prompt: &str,
     ) -> Result<(Provider, String)> {
-        let should_force_fallback = prompt.to_lowercase().contains("/fallback");
-
-        match primary {
-            Provider::Ollama if !should_force_fallback => Ok((
-                Provider::Ollama,
-                self.ollama.chat_model(ollama_model, prompt).await?,
-            )),
-            Provider::Ollama => Ok((
-                Provider::OpenRouter,
-                self.openrouter.chat_model(openrouter_model, prompt).await?,
-            )),
-            Provider::OpenRouter => Ok((
-                Provider::OpenRouter,
-                self.openrouter.chat_model(openrouter_model, prompt).await?,
-            )),
-        }
+        let provider = effective_provider(primary, prompt);
+        let reply = match provider {
+            Provider::Ollama => self.ollama.chat_model(ollama_model, prompt).await?,
+            Provider::OpenRouter => self.openrouter.chat_model(openrouter_model, prompt).await?,
+        };
+        Ok((provider, reply))
     }
 
     /// Like [`chat_with_fallback`] but caps the response length.
@@ -466,49 +519,32 @@ impl LlmRouter {
         prompt: &str,
         max_tokens: u32,
     ) -> Result<(Provider, String)> {
-        let should_force_fallback = prompt.to_lowercase().contains("/fallback");
-
-        match primary {
-            Provider::Ollama if !should_force_fallback => Ok((
-                Provider::Ollama,
+        let provider = effective_provider(primary, prompt);
+        let reply = match provider {
+            Provider::Ollama => {
                 self.ollama
                     .chat_model_limited(ollama_model, prompt, max_tokens)
-                    .await?,
-            )),
-            Provider::Ollama => Ok((
-                Provider::OpenRouter,
-                self.openrouter.chat_model(openrouter_model, prompt).await?,
-            )),
-            Provider::OpenRouter => Ok((
-                Provider::OpenRouter,
-                self.openrouter.chat_model(openrouter_model, prompt).await?,
-            )),
-        }
+                    .await?
+            }
+            Provider::OpenRouter => self.openrouter.chat_model(openrouter_model, prompt).await?,
+        };
+        Ok((provider, reply))
     }
 
+    /// Streaming counterpart of [`chat_with_fallback`](Self::chat_with_fallback).
+    ///
+    /// The provider that handled the prompt is reported in the final
+    /// [`ChatStreamEvent::Done`].
     pub async fn chat_stream_with_fallback(
         &self,
         primary: Provider,
         ollama_model: &str,
         openrouter_model: &str,
         prompt: &str,
-        tx: mpsc::Sender<String>,
-    ) -> Result<(Provider, String)> {
-        let should_force_fallback = prompt.to_lowercase().contains("/fallback");
-
-        match primary {
-            Provider::Ollama if !should_force_fallback => Ok((
-                Provider::Ollama,
-                self.ollama.chat_model_stream(ollama_model, prompt, tx).await?,
-            )),
-            Provider::Ollama => Ok((
-                Provider::OpenRouter,
-                self.openrouter.chat_model_stream(openrouter_model, prompt, tx).await?,
-            )),
-            Provider::OpenRouter => Ok((
-                Provider::OpenRouter,
-                self.openrouter.chat_model_stream(openrouter_model, prompt, tx).await?,
-            )),
+    ) -> Result<ChatStream> {
+        match effective_provider(primary, prompt) {
+            Provider::Ollama => self.ollama.chat_model_stream(ollama_model, prompt).await,
+            Provider::OpenRouter => self.openrouter.chat_model_stream(openrouter_model, prompt).await,
         }
     }
 
@@ -533,7 +569,7 @@ impl LlmRouter {
                 let (content, tool_calls, finish_reason) = self.ollama
                     .chat_messages(ollama_model, messages, tools, json_mode, disable_native_thinking).await?;
                 Ok(ChatResponse {
-                    provider: Provider::Ollama,
+                    provider: ModelProvider::Ollama,
                     content,
                     tool_calls,
                     finish_reason,
@@ -543,7 +579,7 @@ impl LlmRouter {
                 let (content, tool_calls, finish_reason) = self.openrouter
                     .chat_messages(openrouter_model, messages, tools, disable_native_thinking).await?;
                 Ok(ChatResponse {
-                    provider: Provider::OpenRouter,
+                    provider: ModelProvider::OpenRouter,
                     content,
                     tool_calls,
                     finish_reason,
@@ -554,8 +590,9 @@ impl LlmRouter {
 
     /// Send structured chat messages with streaming and optional tool definitions.
     ///
-    /// Text tokens are streamed via `tx` as they arrive. If the model returns
-    /// tool calls, they are accumulated and returned in the final `ChatResponse`.
+    /// Text tokens are yielded as they arrive. If the model returns tool
+    /// calls, they are accumulated and returned in the final
+    /// [`ChatStreamEvent::Done`] response.
     #[allow(clippy::too_many_arguments)]
     pub async fn chat_messages_stream(
         &self,
@@ -564,30 +601,19 @@ impl LlmRouter {
         openrouter_model: &str,
         messages: &[ChatMessage],
         tools: Option<&serde_json::Value>,
-        tx: mpsc::Sender<String>,
         json_mode: bool,
         disable_native_thinking: bool,
-    ) -> Result<ChatResponse> {
+    ) -> Result<ChatStream> {
         match primary {
             Provider::Ollama => {
-                let (content, tool_calls, finish_reason) = self.ollama
-                    .chat_messages_stream(ollama_model, messages, tools, tx, json_mode, disable_native_thinking).await?;
-                Ok(ChatResponse {
-                    provider: Provider::Ollama,
-                    content,
-                    tool_calls,
-                    finish_reason,
-                })
+                self.ollama
+                    .chat_messages_stream(ollama_model, messages, tools, json_mode, disable_native_thinking)
+                    .await
             }
             Provider::OpenRouter => {
-                let (content, tool_calls, finish_reason) = self.openrouter
-                    .chat_messages_stream(openrouter_model, messages, tools, tx, disable_native_thinking).await?;
-                Ok(ChatResponse {
-                    provider: Provider::OpenRouter,
-                    content,
-                    tool_calls,
-                    finish_reason,
-                })
+                self.openrouter
+                    .chat_messages_stream(openrouter_model, messages, tools, disable_native_thinking)
+                    .await
             }
         }
     }
@@ -625,7 +651,7 @@ impl LlmRouter {
         let text = backend.generate(&prompt, max_tokens).await?;
 
         Ok(ChatResponse {
-            provider: Provider::Ollama, // closest enum variant — Candle is local
+            provider: ModelProvider::Candle,
             content: text,
             tool_calls: vec![],
             finish_reason: "stop".to_string(),
@@ -666,9 +692,9 @@ impl LlmClient for LlmRouter {
         provider: ModelProvider,
         model: &str,
         prompt: &str,
-        tx: mpsc::Sender<String>,
-    ) -> Result<(ModelProvider, String)> {
-        // Candle doesn't support true streaming yet — generate fully then send.
+    ) -> Result<ChatStream> {
+        // Candle doesn't support true streaming yet — generate fully, then
+        // yield the text as one token.
         #[cfg(feature = "candle")]
         if provider == ModelProvider::Candle {
             let mut guard = self.get_candle().await?;
@@ -676,15 +702,18 @@ impl LlmClient for LlmRouter {
                 .as_mut()
                 .ok_or_else(|| anyhow::anyhow!("candle backend failed to initialise"))?;
             let text = backend.generate(prompt, backend.config.max_seq_len).await?;
-            let _ = tx.send(text.clone()).await;
-            return Ok((ModelProvider::Candle, text));
+            let response = ChatResponse {
+                provider: ModelProvider::Candle,
+                content: text.clone(),
+                tool_calls: vec![],
+                finish_reason: "stop".to_string(),
+            };
+            return Ok(ready_stream(Some(text), response));
         }
 
         let legacy = Provider::from(provider);
-        let (used, text) = self
-            .chat_stream_with_fallback(legacy, model, model, prompt, tx)
-            .await?;
-        Ok((ModelProvider::from(used), text))
+        self.chat_stream_with_fallback(legacy, model, model, prompt)
+            .await
     }
 
     async fn chat(
@@ -710,18 +739,17 @@ impl LlmClient for LlmRouter {
         model: &str,
         messages: &[ChatMessage],
         tools: Option<&serde_json::Value>,
-        tx: mpsc::Sender<String>,
-    ) -> Result<ChatResponse> {
-        // Candle doesn't support streaming — generate fully then send.
+    ) -> Result<ChatStream> {
+        // Candle doesn't support streaming — generate fully, then yield the
+        // text as one token.
         #[cfg(feature = "candle")]
         if provider == ModelProvider::Candle {
             let resp = self.candle_chat(messages, tools).await?;
-            let _ = tx.send(resp.content.clone()).await;
-            return Ok(resp);
+            return Ok(ready_stream(Some(resp.content.clone()), resp));
         }
 
         let legacy = Provider::from(provider);
-        self.chat_messages_stream(legacy, model, model, messages, tools, tx, false, false)
+        self.chat_messages_stream(legacy, model, model, messages, tools, false, false)
             .await
     }
 }
@@ -766,20 +794,20 @@ impl OllamaClient {
             payload["think"] = json!(false);
         }
 
-        let client = self.client.clone();
+        let client = &self.client;
         let response = client.post(endpoint).json(&payload).send().await;
 
         match response {
             Ok(response) => {
                 let status = response.status();
-                let body: serde_json::Value = response.json().await?;
+                let mut body: serde_json::Value = response.json().await?;
                 if !status.is_success() {
                     return Ok(format!("Ollama error ({status}): {body}"));
                 }
 
-                if let Some(content) = body.get("response").and_then(|value| value.as_str()) {
+                if let Some(content) = take_str(body.get_mut("response")) {
                     if !content.is_empty() {
-                        return Ok(content.to_string());
+                        return Ok(content);
                     }
                 }
 
@@ -787,14 +815,14 @@ impl OllamaClient {
                 // `thinking` field and may leave `response` empty.  This is
                 // a safety-net fallback — normally `think: false` keeps the
                 // output in `response`.
-                if let Some(thinking) = body.get("thinking").and_then(|v| v.as_str()) {
+                if let Some(thinking) = take_str(body.get_mut("thinking")) {
                     if !thinking.is_empty() {
                         tracing::warn!(
                             model,
                             "Ollama: response empty, falling back to thinking field — \
                              consider setting think=false for this model"
                         );
-                        return Ok(thinking.to_string());
+                        return Ok(thinking);
                     }
                 }
 
@@ -806,12 +834,7 @@ impl OllamaClient {
         }
     }
 
-    async fn chat_model_stream(
-        &self,
-        model: &str,
-        prompt: &str,
-        tx: mpsc::Sender<String>,
-    ) -> Result<String> {
+    async fn chat_model_stream(&self, model: &str, prompt: &str) -> Result<ChatStream> {
         let base_url = std::env::var("OLLAMA_BASE_URL")
             .unwrap_or_else(|_| "http://localhost:11434".to_string());
         let endpoint = format!("{}/api/generate", base_url.trim_end_matches('/'));
@@ -822,35 +845,17 @@ impl OllamaClient {
             "stream": true
         });
 
-        let client = self.client.clone();
-        let mut response = client.post(endpoint).json(&payload).send().await?;
+        let client = &self.client;
+        let response = client.post(endpoint).json(&payload).send().await?;
 
         let status = response.status();
         if !status.is_success() {
             let body: serde_json::Value = response.json().await?;
-            return Ok(format!("Ollama error ({status}): {body}"));
-        }
-
-        let mut full_response = String::new();
-        while let Some(chunk) = response.chunk().await? {
-            let chunk_str = String::from_utf8_lossy(&chunk);
-            for line in chunk_str.lines() {
-                if line.trim().is_empty() {
-                    continue;
-                }
-                if let Ok(json) = serde_json::from_str::<serde_json::Value>(line) {
-                    if let Some(content) = json.get("response").and_then(|v| v.as_str()) {
-                        if content.is_empty() {
-                            continue;
-                        }
-                        full_response.push_str(content);
-                        let _ = tx.send(content.to_string()).await;
-                    }
-                }
-            }
+            let err_msg = format!("Ollama error ({status}): {body}");
+            return Ok(ready_stream(None, text_response(ModelProvider::Ollama, err_msg)));
         }
 
-        Ok(full_response)
+        Ok(decode_stream(ModelProvider::Ollama, body_stream(response), OllamaGenerateDecoder))
     }
 
     /// Structured chat using Ollama's `/api/chat` endpoint with optional tools.
@@ -888,7 +893,7 @@ impl OllamaClient {
             payload["tools"] = tools_val.clone();
         }
 
-        let response = self.client.clone().post(&endpoint).json(&payload).send().await;
+        let response = self.client.post(&endpoint).json(&payload).send().await;
         match response {
             Ok(response) => {
                 let status = response.status();
@@ -896,7 +901,7 @@ impl OllamaClient {
                 if !status.is_success() {
                     return Ok((format!("Ollama error ({status}): {body}"), vec![], "error".to_string()));
                 }
-                parse_ollama_chat_response(&body)
+                parse_ollama_chat_response(body)
             }
             Err(error) => Ok((
                 format!("Ollama unavailable at {base_url}. Error: {error}"),
@@ -912,10 +917,9 @@ impl OllamaClient {
         model: &str,
         messages: &[ChatMessage],
         tools: Option<&serde_json::Value>,
-        tx: mpsc::Sender<String>,
         json_mode: bool,
         disable_native_thinking: bool,
-    ) -> Result<(String, Vec<ToolCall>, String)> {
+    ) -> Result<ChatStream> {
         let base_url = std::env::var("OLLAMA_BASE_URL")
             .unwrap_or_else(|_| "http://localhost:11434".to_string());
         let endpoint = format!("{}/api/chat", base_url.trim_end_matches('/'));
@@ -939,56 +943,289 @@ impl OllamaClient {
             payload["tools"] = tools_val.clone();
         }
 
-        let mut response = self.client.clone().post(&endpoint).json(&payload).send().await?;
+        let response = self.client.post(&endpoint).json(&payload).send().await?;
         let status = response.status();
         if !status.is_success() {
             let body: serde_json::Value = response.json().await?;
             let err_msg = format!("Ollama error ({status}): {body}");
-            let _ = tx.send(err_msg.clone()).await;
-            return Ok((err_msg, vec![], "error".to_string()));
+            return Ok(error_stream(ModelProvider::Ollama, err_msg));
         }
 
-        let mut full_response = String::new();
-        let mut tool_calls: Vec<ToolCall> = vec![];
-        let mut finish_reason = "stop".to_string();
+        Ok(decode_stream(ModelProvider::Ollama, body_stream(response), OllamaChatDecoder::default()))
+    }
+}
 
-        while let Some(chunk) = response.chunk().await? {
-            let chunk_str = String::from_utf8_lossy(&chunk);
-            for line in chunk_str.lines() {
-                if line.trim().is_empty() {
-                    continue;
-                }
-                if let Ok(json) = serde_json::from_str::<serde_json::Value>(line) {
-                    // Extract streamed text content
-                    if let Some(content) = json.get("message")
-                        .and_then(|m| m.get("content"))
-                        .and_then(|v| v.as_str())
-                    {
-                        if !content.is_empty() {
-                            full_response.push_str(content);
-                            let _ = tx.send(content.to_string()).await;
-                        }
-                    }
-                    // Extract tool calls from the final chunk
-                    if json.get("done").and_then(|v| v.as_bool()).unwrap_or(false) {
-                        if let Some(calls) = json.get("message")
-                            .and_then(|m| m.get("tool_calls"))
-                            .and_then(|v| v.as_array())
-                        {
-                            tool_calls = parse_ollama_tool_calls(calls);
-                            if !tool_calls.is_empty() {
-                                finish_reason = "tool_calls".to_string();
-                            }
-                        }
+// ── Streaming wire types ─────────────────────────────────────────────────────
+//
+// Typed views of the per-token stream lines.  Deserializing straight into
+// these skips building a `serde_json::Value` map for every token; unknown
+// fields are ignored and the token text is decoded directly into the
+// `String` that is then yielded as a token.
+
+/// One NDJSON line from Ollama `/api/generate` with `stream: true`.
+#[derive(Deserialize)]
+struct OllamaGenerateChunk {
+    response: Option<String>,
+}
+
+/// One NDJSON line from Ollama `/api/chat` with `stream: true`.
+#[derive(Deserialize)]
+struct OllamaChatChunk {
+    message: Option<OllamaChatDelta>,
+    #[serde(default)]
+    done: bool,
+}
+
+#[derive(Deserialize)]
+struct OllamaChatDelta {
+    content: Option<String>,
+    /// Only present on the final chunk; kept as raw values for
+    /// [`parse_ollama_tool_calls`].
+    tool_calls: Option<Vec<serde_json::Value>>,
+}
+
+/// One `data:` payload from an OpenAI-compatible SSE completion stream.
+#[derive(Deserialize)]
+struct OpenAiStreamChunk {
+    #[serde(default)]
+    choices: Vec<OpenAiStreamChoice>,
+}
+
+#[derive(Deserialize)]
+struct OpenAiStreamChoice {
+    delta: Option<OpenAiStreamDelta>,
+    finish_reason: Option<String>,
+}
+
+#[derive(Deserialize)]
+struct OpenAiStreamDelta {
+    content: Option<String>,
+    tool_calls: Option<Vec<OpenAiToolCallDelta>>,
+}
+
+#[derive(Deserialize)]
+struct OpenAiToolCallDelta {
+    index: Option<usize>,
+    id: Option<String>,
+    function: Option<OpenAiFunctionDelta>,
+}
+
+#[derive(Deserialize)]
+struct OpenAiFunctionDelta {
+    name: Option<String>,
+    /// Normally a string fragment; kept loose so a provider that sends
+    /// something else does not make the whole line (and its text) unparseable.
+    arguments: Option<serde_json::Value>,
+}
+
+/// Read a streaming response body on its own task.
+///
+/// Chunks are handed over a small bounded channel, so receiving the next
+/// chunk from the socket (and TLS decryption) overlaps with line scanning,
+/// JSON parsing and token forwarding on the caller's task.  The reader stops
+/// at end of body, after forwarding an error, or once the receiver is dropped.
+fn spawn_body_reader(
+    mut response: reqwest::Response,
+) -> mpsc::Receiver<reqwest::Result<bytes::Bytes>> {
+    let (tx, rx) = mpsc::channel(32);
+    tokio::spawn(async move {
+        loop {
+            match response.chunk().await {
+                Ok(Some(chunk)) => {
+                    if tx.send(Ok(chunk)).await.is_err() {
+                        break;
                     }
                 }
+                Ok(None) => break,
+                Err(err) => {
+                    let _ = tx.send(Err(err)).await;
+                    break;
+                }
+            }
+        }
+    });
+    rx
+}
+
+/// A streaming response body as a `Stream` of chunks, fed by
+/// [`spawn_body_reader`].
+///
+/// It ends at end of body or after yielding the first error, and keeps
+/// returning `None` if polled again after that.
+fn body_stream(
+    response: reqwest::Response,
+) -> impl Stream<Item = reqwest::Result<bytes::Bytes>> + Send + Unpin {
+    let mut chunks = spawn_body_reader(response);
+    futures::stream::poll_fn(move |cx| chunks.poll_recv(cx))
+}
+
+/// Whether an OpenAI-style SSE `data:` payload has a `"content"` key at all.
+///
+/// Role-only, tool-call, `finish_reason` and usage frames carry no text, so
+/// the text-only stream skips them with a substring check instead of a full
+/// JSON parse.  A `false` is definitive; a `true` still has to be parsed.
+fn may_carry_content(data: &[u8]) -> bool {
+    memchr::memmem::find(data, b"\"content\"").is_some()
+}
+
+// ── Stream decoders ──────────────────────────────────────────────────────────
+//
+// One per streaming endpoint; see `chat_stream::decode_stream` for the
+// shared read / batch / finish loop.
+
+/// Ollama `/api/generate`: text only.
+struct OllamaGenerateDecoder;
+
+impl StreamDecoder for OllamaGenerateDecoder {
+    fn decode_line(&mut self, line: &[u8]) -> Option<String> {
+        let chunk = serde_json::from_slice::<OllamaGenerateChunk>(line).ok()?;
+        chunk.response.filter(|content| !content.is_empty())
+    }
+
+    fn finish(self) -> (Vec<ToolCall>, String) {
+        (vec![], "stop".to_string())
+    }
+}
+
+/// Ollama `/api/chat`: text, plus tool calls on the final (`done`) line.
+#[derive(Default)]
+struct OllamaChatDecoder {
+    tool_calls: Vec<ToolCall>,
+}
+
+impl StreamDecoder for OllamaChatDecoder {
+    fn decode_line(&mut self, line: &[u8]) -> Option<String> {
+        let chunk = serde_json::from_slice::<OllamaChatChunk>(line).ok()?;
+        let message = chunk.message?;
+        if chunk.done {
+            if let Some(calls) = message.tool_calls {
+                self.tool_calls = parse_ollama_tool_calls(&calls);
             }
         }
+        message.content.filter(|content| !content.is_empty())
+    }
 
-        Ok((full_response, tool_calls, finish_reason))
+    fn finish(self) -> (Vec<ToolCall>, String) {
+        let finish_reason = if self.tool_calls.is_empty() { "stop" } else { "tool_calls" };
+        (self.tool_calls, finish_reason.to_string())
     }
 }
 
+/// OpenAI-compatible SSE completion without tools: text only.
+struct OpenAiTextDecoder;
+
+impl StreamDecoder for OpenAiTextDecoder {
+    fn decode_line(&mut self, line: &[u8]) -> Option<String> {
+        let data = line.strip_prefix(b"data: ")?;
+        if !may_carry_content(data) {
+            return None;
+        }
+        let chunk = serde_json::from_slice::<OpenAiStreamChunk>(data).ok()?;
+        chunk
+            .choices
+            .into_iter()
+            .next()?
+            .delta?
+            .content
+            .filter(|content| !content.is_empty())
+    }
+
+    fn finish(self) -> (Vec<ToolCall>, String) {
+        (vec![], "stop".to_string())
+    }
+}
+
+/// OpenAI-compatible SSE chat: text, plus tool calls accumulated from
+/// per-index deltas.
+#[derive(Default)]
+struct OpenAiChatDecoder {
+    /// (id, name, arguments) by tool-call index.
+    tool_call_map: HashMap<usize, (String, String, String)>,
+    finish_reason: Option<String>,
+}
+
+impl StreamDecoder for OpenAiChatDecoder {
+    fn decode_line(&mut self, line: &[u8]) -> Option<String> {
+        let data = line.strip_prefix(b"data: ")?;
+        if data == b"[DONE]" {
+            return None;
+        }
+        let chunk = serde_json::from_slice::<OpenAiStreamChunk>(data).ok()?;
+        let choice = chunk.choices.into_iter().next()?;
+
+        if let Some(fr) = choice.finish_reason {
+            self.finish_reason = Some(fr);
+        }
+
+        let delta = choice.delta?;
+
+        // Accumulate tool call deltas
+        for tc in delta.tool_calls.unwrap_or_default() {
+            let idx = tc.index.unwrap_or(0);
+            let entry = self.tool_call_map.entry(idx).or_default();
+            if let Some(id) = tc.id {
+                entry.0 = id;
+            }
+            if let Some(func) = tc.function {
+                if let Some(name) = func.name {
+                    // Name is sent once in the first delta, not
+                    // incrementally — assign rather than append.
+                    entry.1 = name;
+                }
+                if let Some(serde_json::Value::String(args)) = func.arguments {
+                    entry.2.push_str(&args);
+                }
+            }
+        }
+
+        delta.content.filter(|content| !content.is_empty())
+    }
+
+    fn finish(self) -> (Vec<ToolCall>, String) {
+        let mut finish_reason = self.finish_reason.unwrap_or_else(|| "stop".to_string());
+        let mut indices: Vec<usize> = self.tool_call_map.keys().copied().collect();
+        indices.sort();
+        let tool_calls: Vec<ToolCall> = indices
+            .into_iter()
+            .map(|idx| {
+                let (id, name, args_str) = &self.tool_call_map[&idx];
+                let arguments = serde_json::from_str(args_str).unwrap_or(json!({}));
+                ToolCall {
+                    id: if id.is_empty() { format!("call_{idx}") } else { id.clone() },
+                    r#type: "function".to_string(),
+                    function: ToolCallFunction { name: name.clone(), arguments },
+                }
+            })
+            .collect();
+        if !tool_calls.is_empty() && finish_reason == "stop" {
+            finish_reason = "tool_calls".to_string();
+        }
+        (tool_calls, finish_reason)
+    }
+}
+
+/// A plain-text response with no tool calls.
+fn text_response(provider: ModelProvider, content: String) -> ChatResponse {
+    ChatResponse {
+        provider,
+        content,
+        tool_calls: vec![],
+        finish_reason: "stop".to_string(),
+    }
+}
+
+/// A structured-chat stream that reports `err_msg` both as its only token
+/// (so a UI shows it) and as the `"error"` response.
+fn error_stream(provider: ModelProvider, err_msg: String) -> ChatStream {
+    let response = ChatResponse {
+        provider,
+        content: err_msg.clone(),
+        tool_calls: vec![],
+        finish_reason: "error".to_string(),
+    };
+    ready_stream(Some(err_msg), response)
+}
+
 /// Convert our `ChatMessage` array to Ollama's message format.
 fn messages_to_ollama(messages: &[ChatMessage]) -> Vec<serde_json::Value> {
     messages.iter().map(|m| {
@@ -1022,12 +1259,9 @@ fn messages_to_ollama(messages: &[ChatMessage]) -> Vec<serde_json::Value> {
 }
 
 /// Parse Ollama's `/api/chat` non-streaming response.
-fn parse_ollama_chat_response(body: &serde_json::Value) -> Result<(String, Vec<ToolCall>, String)> {
-    let content = body.get("message")
-        .and_then(|m| m.get("content"))
-        .and_then(|v| v.as_str())
-        .unwrap_or("")
-        .to_string();
+fn parse_ollama_chat_response(mut body: serde_json::Value) -> Result<(String, Vec<ToolCall>, String)> {
+    let content = take_str(body.get_mut("message").and_then(|m| m.get_mut("content")))
+        .unwrap_or_default();
 
     let tool_calls = body.get("message")
         .and_then(|m| m.get("tool_calls"))
@@ -1044,6 +1278,17 @@ fn parse_ollama_chat_response(body: &serde_json::Value) -> Result<(String, Vec<T
     Ok((content, tool_calls, finish_reason))
 }
 
+/// Move a string out of a parsed JSON field, leaving `Null` behind.
+///
+/// The parsed `Value` already owns the decoded text, so taking it avoids a
+/// second allocation and copy compared to `as_str().to_string()`.
+fn take_str(value: Option<&mut serde_json::Value>) -> Option<String> {
+    match value.map(serde_json::Value::take) {
+        Some(serde_json::Value::String(s)) => Some(s),
+        _ => None,
+    }
+}
+
 /// Parse Ollama tool_calls array into our `ToolCall` type.
 fn parse_ollama_tool_calls(calls: &[serde_json::Value]) -> Vec<ToolCall> {
     calls.iter().enumerate().filter_map(|(i, call)| {
@@ -1063,7 +1308,7 @@ impl OpenRouterClient {
         let api_key = std::env::var("OPENROUTER_API_KEY").ok();
         if let Some(api_key) = api_key {
             if !api_key.trim().is_empty() {
-                let client = self.client.clone();
+                let client = &self.client;
                 let payload = json!({
                     "model": model,
                     "messages": [
@@ -1081,19 +1326,18 @@ impl OpenRouterClient {
                     .await?;
 
                 let status = response.status();
-                let body: serde_json::Value = response.json().await?;
+                let mut body: serde_json::Value = response.json().await?;
                 if !status.is_success() {
                     return Ok(format!("OpenRouter error ({status}): {body}"));
                 }
 
-                if let Some(content) = body
-                    .get("choices")
-                    .and_then(|choices| choices.get(0))
-                    .and_then(|choice| choice.get("message"))
-                    .and_then(|message| message.get("content"))
-                    .and_then(|content| content.as_str())
-                {
-                    return Ok(content.to_string());
+                if let Some(content) = take_str(
+                    body.get_mut("choices")
+                        .and_then(|choices| choices.get_mut(0))
+                        .and_then(|choice| choice.get_mut("message"))
+                        .and_then(|message| message.get_mut("content")),
+                ) {
+                    return Ok(content);
                 }
             }
         }
@@ -1104,16 +1348,11 @@ impl OpenRouterClient {
         )
     }
 
-    async fn chat_model_stream(
-        &self,
-        model: &str,
-        prompt: &str,
-        tx: mpsc::Sender<String>,
-    ) -> Result<String> {
+    async fn chat_model_stream(&self, model: &str, prompt: &str) -> Result<ChatStream> {
         let api_key = std::env::var("OPENROUTER_API_KEY").ok();
         if let Some(api_key) = api_key {
             if !api_key.trim().is_empty() {
-                let client = self.client.clone();
+                let client = &self.client;
                 let payload = json!({
                     "model": model,
                     "messages": [
@@ -1122,7 +1361,7 @@ impl OpenRouterClient {
                     "stream": true
                 });
 
-                let mut response = client
+                let response = client
                     .post("https://openrouter.ai/api/v1/chat/completions")
                     .bearer_auth(api_key)
                     .header("HTTP-Referer", "https://aigent.local")
@@ -1134,45 +1373,16 @@ impl OpenRouterClient {
                 let status = response.status();
                 if !status.is_success() {
                     let body: serde_json::Value = response.json().await?;
-                    return Ok(format!("OpenRouter error ({status}): {body}"));
+                    let err_msg = format!("OpenRouter error ({status}): {body}");
+                    return Ok(ready_stream(None, text_response(ModelProvider::OpenRouter, err_msg)));
                 }
 
-                let mut full_response = String::new();
-                while let Some(chunk) = response.chunk().await? {
-                    let chunk_str = String::from_utf8_lossy(&chunk);
-                    for line in chunk_str.lines() {
-                        let line = line.trim();
-                        if line.is_empty() || line == "data: [DONE]" {
-                            continue;
-                        }
-                        if let Some(data) = line.strip_prefix("data: ") {
-                            if let Ok(json) = serde_json::from_str::<serde_json::Value>(data) {
-                                if let Some(content) = json
-                                    .get("choices")
-                                    .and_then(|choices| choices.get(0))
-                                    .and_then(|choice| choice.get("delta"))
-                                    .and_then(|delta| delta.get("content"))
-                                    .and_then(|content| content.as_str())
-                                {
-                                    if content.is_empty() {
-                                        continue;
-                                    }
-                                    full_response.push_str(content);
-                                    let _ = tx.send(content.to_string()).await;
-                                }
-                            }
-                        }
-                    }
-                }
-
-                return Ok(full_response);
+                return Ok(decode_stream(ModelProvider::OpenRouter, body_stream(response), OpenAiTextDecoder));
             }
         }
 
-        Ok(
-            "OpenRouter key missing or response empty. Set OPENROUTER_API_KEY or switch to /model provider ollama."
-                .to_string(),
-        )
+        let err_msg = "OpenRouter key missing or response empty. Set OPENROUTER_API_KEY or switch to /model provider ollama.";
+        Ok(ready_stream(None, text_response(ModelProvider::OpenRouter, err_msg.to_string())))
     }
 
     /// Structured chat using OpenRouter's `/chat/completions` endpoint with optional tools.
@@ -1197,7 +1407,7 @@ impl OpenRouterClient {
             payload["tools"] = tools_val.clone();
         }
 
-        let response = self.client.clone()
+        let response = self.client
             .post("https://openrouter.ai/api/v1/chat/completions")
             .bearer_auth(&api_key)
             .header("HTTP-Referer", "https://aigent.local")
@@ -1211,7 +1421,7 @@ impl OpenRouterClient {
         if !status.is_success() {
             return Ok((format!("OpenRouter error ({status}): {body}"), vec![], "error".to_string()));
         }
-        parse_openai_chat_response(&body)
+        parse_openai_chat_response(body)
     }
 
     /// Streaming structured chat using OpenRouter's `/chat/completions` endpoint with tools.
@@ -1220,14 +1430,12 @@ impl OpenRouterClient {
         model: &str,
         messages: &[ChatMessage],
         tools: Option<&serde_json::Value>,
-        tx: mpsc::Sender<String>,
         _disable_native_thinking: bool,
-    ) -> Result<(String, Vec<ToolCall>, String)> {
+    ) -> Result<ChatStream> {
         let api_key = std::env::var("OPENROUTER_API_KEY").ok();
         let Some(api_key) = api_key.filter(|k| !k.trim().is_empty()) else {
             let err_msg = "OpenRouter key missing. Set OPENROUTER_API_KEY.".to_string();
-            let _ = tx.send(err_msg.clone()).await;
-            return Ok((err_msg, vec![], "error".to_string()));
+            return Ok(error_stream(ModelProvider::OpenRouter, err_msg));
         };
 
         let openai_messages = messages_to_openai(messages);
@@ -1240,7 +1448,7 @@ impl OpenRouterClient {
             payload["tools"] = tools_val.clone();
         }
 
-        let mut response = self.client.clone()
+        let response = self.client
             .post("https://openrouter.ai/api/v1/chat/completions")
             .bearer_auth(&api_key)
             .header("HTTP-Referer", "https://aigent.local")
@@ -1253,87 +1461,10 @@ impl OpenRouterClient {
         if !status.is_success() {
             let body: serde_json::Value = response.json().await?;
             let err_msg = format!("OpenRouter error ({status}): {body}");
-            let _ = tx.send(err_msg.clone()).await;
-            return Ok((err_msg, vec![], "error".to_string()));
-        }
-
-        let mut full_response = String::new();
-        // Accumulate tool call deltas by index
-        let mut tool_call_map: HashMap<usize, (String, String, String)> = HashMap::new(); // (id, name, arguments)
-        let mut finish_reason = "stop".to_string();
-
-        while let Some(chunk) = response.chunk().await? {
-            let chunk_str = String::from_utf8_lossy(&chunk);
-            for line in chunk_str.lines() {
-                let line = line.trim();
-                if line.is_empty() || line == "data: [DONE]" {
-                    continue;
-                }
-                let Some(data) = line.strip_prefix("data: ") else { continue };
-                let Ok(json) = serde_json::from_str::<serde_json::Value>(data) else { continue };
-
-                let choice = json.get("choices").and_then(|c| c.get(0));
-                let Some(choice) = choice else { continue };
-
-                // Check finish_reason
-                if let Some(fr) = choice.get("finish_reason").and_then(|v| v.as_str()) {
-                    finish_reason = fr.to_string();
-                }
-
-                let delta = choice.get("delta");
-                let Some(delta) = delta else { continue };
-
-                // Accumulate text content
-                if let Some(content) = delta.get("content").and_then(|v| v.as_str()) {
-                    if !content.is_empty() {
-                        full_response.push_str(content);
-                        let _ = tx.send(content.to_string()).await;
-                    }
-                }
-
-                // Accumulate tool call deltas
-                if let Some(tcs) = delta.get("tool_calls").and_then(|v| v.as_array()) {
-                    for tc in tcs {
-                        let idx = tc.get("index").and_then(|v| v.as_u64()).unwrap_or(0) as usize;
-                        let entry = tool_call_map.entry(idx).or_insert_with(|| (String::new(), String::new(), String::new()));
-                        if let Some(id) = tc.get("id").and_then(|v| v.as_str()) {
-                            entry.0 = id.to_string();
-                        }
-                        if let Some(func) = tc.get("function") {
-                            if let Some(name) = func.get("name").and_then(|v| v.as_str()) {
-                                // Name is sent once in the first delta, not
-                                // incrementally — assign rather than append.
-                                entry.1 = name.to_string();
-                            }
-                            if let Some(args) = func.get("arguments").and_then(|v| v.as_str()) {
-                                entry.2.push_str(args);
-                            }
-                        }
-                    }
-                }
-            }
+            return Ok(error_stream(ModelProvider::OpenRouter, err_msg));
         }
 
-        // Convert accumulated tool call deltas to ToolCall structs
-        let mut tool_calls: Vec<ToolCall> = Vec::new();
-        if !tool_call_map.is_empty() {
-            let mut indices: Vec<usize> = tool_call_map.keys().copied().collect();
-            indices.sort();
-            for idx in indices {
-                let (id, name, args_str) = &tool_call_map[&idx];
-                let arguments = serde_json::from_str(args_str).unwrap_or(json!({}));
-                tool_calls.push(ToolCall {
-                    id: if id.is_empty() { format!("call_{idx}") } else { id.clone() },
-                    r#type: "function".to_string(),
-                    function: ToolCallFunction { name: name.clone(), arguments },
-                });
-            }
-            if finish_reason == "stop" {
-                finish_reason = "tool_calls".to_string();
-            }
-        }
-
-        Ok((full_response, tool_calls, finish_reason))
+        Ok(decode_stream(ModelProvider::OpenRouter, body_stream(response), OpenAiChatDecoder::default()))
     }
 }
 
@@ -1377,16 +1508,18 @@ fn messages_to_openai(messages: &[ChatMessage]) -> Vec<serde_json::Value> {
 }
 
 /// Parse an OpenAI-compatible `/chat/completions` non-streaming response.
-fn parse_openai_chat_response(body: &serde_json::Value) -> Result<(String, Vec<ToolCall>, String)> {
+fn parse_openai_chat_response(mut body: serde_json::Value) -> Result<(String, Vec<ToolCall>, String)> {
+    let content = take_str(
+        body.get_mut("choices")
+            .and_then(|c| c.get_mut(0))
+            .and_then(|c| c.get_mut("message"))
+            .and_then(|m| m.get_mut("content")),
+    )
+    .unwrap_or_default();
+
     let choice = body.get("choices").and_then(|c| c.get(0));
     let message = choice.and_then(|c| c.get("message"));
 
-    let content = message
-        .and_then(|m| m.get("content"))
-        .and_then(|v| v.as_str())
-        .unwrap_or("")
-        .to_string();
-
     let finish_reason = choice
         .and_then(|c| c.get("finish_reason"))
         .and_then(|v| v.as_str())
@@ -1513,6 +1646,135 @@ mod tests {
         assert_eq!(out.params, serde_json::Value::Null);
     }
 
+    // ── requests_fallback ──────────────────────────────────────────────────
+
+    #[test]
+    fn requests_fallback_is_case_insensitive() {
+        assert!(requests_fallback("please answer /fallback"));
+        assert!(requests_fallback("/FallBack now"));
+        assert!(requests_fallback("a/b /fallback"));
+        assert!(!requests_fallback("fallback without slash"));
+        assert!(!requests_fallback("/fallbac"));
+        assert!(!requests_fallback("café / naïve"));
+    }
+
+    #[test]
+    fn effective_provider_reroutes_only_marked_ollama_prompts() {
+        assert_eq!(effective_provider(Provider::Ollama, "hi"), Provider::Ollama);
+        assert_eq!(effective_provider(Provider::Ollama, "hi /fallback"), Provider::OpenRouter);
+        assert_eq!(effective_provider(Provider::OpenRouter, "hi"), Provider::OpenRouter);
+    }
+
+    // ── take_str ───────────────────────────────────────────────────────────
+
+    #[test]
+    fn take_str_moves_string_out() {
+        let mut json = serde_json::json!({"message": {"content": "hi"}, "done": false});
+        let content = take_str(json.get_mut("message").and_then(|m| m.get_mut("content")));
+        assert_eq!(content.as_deref(), Some("hi"));
+        assert!(json["message"]["content"].is_null());
+        assert_eq!(json["done"], false);
+    }
+
+    #[test]
+    fn take_str_ignores_missing_and_non_string() {
+        let mut json = serde_json::json!({"response": 42});
+        assert!(take_str(json.get_mut("response")).is_none());
+        assert!(take_str(json.get_mut("absent")).is_none());
+    }
+
+    // ── Streaming wire types ───────────────────────────────────────────────
+
+    #[test]
+    fn ollama_chat_chunk_reads_content_and_final_tool_calls() {
+        let line = br#"{"model":"m","message":{"role":"assistant","content":"a\nb"},"done":false}"#;
+        let chunk: OllamaChatChunk = serde_json::from_slice(line).unwrap();
+        assert!(!chunk.done);
+        assert_eq!(chunk.message.unwrap().content.as_deref(), Some("a\nb"));
+
+        let line = br#"{"message":{"role":"assistant","content":"","tool_calls":[{"function":{"name":"read","arguments":{}}}]},"done":true}"#;
+        let chunk: OllamaChatChunk = serde_json::from_slice(line).unwrap();
+        assert!(chunk.done);
+        let calls = chunk.message.unwrap().tool_calls.unwrap();
+        assert_eq!(parse_ollama_tool_calls(&calls)[0].function.name, "read");
+    }
+
+    #[test]
+    fn openai_stream_chunk_tolerates_nulls_and_empty_choices() {
+        let data = br#"{"choices":[{"index":0,"delta":{"content":null,"tool_calls":[{"index":1,"id":null,"function":{"arguments":"{\"a\":"}}]},"finish_reason":null}]}"#;
+        let chunk: OpenAiStreamChunk = serde_json::from_slice(data).unwrap();
+        let choice = chunk.choices.into_iter().next().unwrap();
+        assert!(choice.finish_reason.is_none());
+        let delta = choice.delta.unwrap();
+        assert!(delta.content.is_none());
+        let tc = &delta.tool_calls.unwrap()[0];
+        assert_eq!(tc.index, Some(1));
+        assert_eq!(tc.function.as_ref().unwrap().arguments, Some(serde_json::json!("{\"a\":")));
+
+        let usage = br#"{"choices":[],"usage":{"total_tokens":3}}"#;
+        let chunk: OpenAiStreamChunk = serde_json::from_slice(usage).unwrap();
+        assert!(chunk.choices.is_empty());
+    }
+
+    #[test]
+    fn content_precheck_skips_only_textless_frames() {
+        assert!(may_carry_content(br#"{"choices":[{"delta":{"content":"hi"}}]}"#));
+        assert!(may_carry_content(br#"{"choices":[{"delta":{"role":"assistant","content":""}}]}"#));
+        assert!(!may_carry_content(br#"{"choices":[{"delta":{},"finish_reason":"stop"}]}"#));
+        assert!(!may_carry_content(br#"{"choices":[],"usage":{"total_tokens":3}}"#));
+    }
+
+    // ── Stream decoders ────────────────────────────────────────────────────
+
+    #[test]
+    fn openai_chat_decoder_assembles_tool_call_deltas() {
+        let mut decoder = OpenAiChatDecoder::default();
+        let lines: [&[u8]; 5] = [
+            br#"data: {"choices":[{"delta":{"content":"Let me look."}}]}"#,
+            br#"data: {"choices":[{"delta":{"tool_calls":[{"index":0,"id":"c1","function":{"name":"read","arguments":"{\"pa"}}]}}]}"#,
+            br#"data: {"choices":[{"delta":{"tool_calls":[{"index":0,"function":{"arguments":"th\":\"a\"}"}}]}}]}"#,
+            br#"data: {"choices":[{"delta":{},"finish_reason":"stop"}]}"#,
+            b"data: [DONE]",
+        ];
+        let text: Vec<String> = lines.iter().filter_map(|line| decoder.decode_line(line)).collect();
+        assert_eq!(text, ["Let me look."]);
+
+        let (calls, finish_reason) = decoder.finish();
+        assert_eq!(finish_reason, "tool_calls");
+        assert_eq!(calls[0].id, "c1");
+        assert_eq!(calls[0].function.name, "read");
+        assert_eq!(calls[0].function.arguments, serde_json::json!({"path": "a"}));
+    }
+
+    #[tokio::test]
+    async fn ollama_chat_stream_yields_tokens_then_response() {
+        use futures::StreamExt;
+
+        let body = concat!(
+            r#"{"message":{"role":"assistant","content":"Hel"},"done":false}"#, "\n",
+            r#"{"message":{"role":"assistant","content":"lo"},"done":false}"#, "\n",
+            r#"{"message":{"role":"assistant","content":"","tool_calls":[{"function":{"name":"read","arguments":{}}}]},"done":true}"#,
+        );
+        // Split mid-line to exercise the carry buffer.
+        let chunks = [&body[..20], &body[20..]]
+            .map(|part| Ok::<_, std::io::Error>(bytes::Bytes::copy_from_slice(part.as_bytes())));
+        let stream = decode_stream(ModelProvider::Ollama, futures::stream::iter(chunks), OllamaChatDecoder::default());
+
+        let mut tokens = String::new();
+        let mut done = None;
+        for event in stream.collect::<Vec<_>>().await {
+            match event.unwrap() {
+                ChatStreamEvent::Token(text) => tokens.push_str(&text),
+                ChatStreamEvent::Done(response) => done = Some(response),
+            }
+        }
+        let done = done.unwrap();
+        assert_eq!(tokens, "Hello");
+        assert_eq!(done.content, "Hello");
+        assert_eq!(done.finish_reason, "tool_calls");
+        assert_eq!(done.tool_calls[0].function.name, "read");
+    }
+
     // ── extract_json_output: fenced code block ─────────────────────────────
 
     #[test]
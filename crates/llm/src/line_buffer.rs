@@ -0,0 +1,141 @@
+//! Incremental line scanner for streamed NDJSON / SSE response bodies.
+//!
+//! Network chunks respect neither line nor UTF-8 boundaries.  [`LineBuffer`]
+//! carries the unfinished tail between chunks as raw bytes and hands out
+//! complete lines as `&[u8]`, so each line can be fed straight to
+//! `serde_json::from_slice` — no per-chunk lossy UTF-8 conversion, and a
+//! multi-byte codepoint or JSON object split across two chunks is rejoined
+//! before it is parsed.
+
+// ── LineBuffer ─────────────────────────────────────────────────────────────────
+
+/// Byte carry buffer that yields newline-terminated lines.
+pub(crate) struct LineBuffer {
+    buf: Vec<u8>,
+    /// Start of the first line not yet handed out.
+    start: usize,
+    /// Bytes before this offset are known to contain no `\n`, so a long
+    /// line arriving over many chunks is only scanned once.
+    searched: usize,
+}
+
+impl LineBuffer {
+    pub(crate) fn new() -> Self {
+        Self {
+            buf: Vec::with_capacity(8192),
+            start: 0,
+            searched: 0,
+        }
+    }
+
+    /// Feed the next body chunk, or `None` at end of body.
+    ///
+    /// `decode_stream` feeds each chunk as it arrives and then drains
+    /// [`next_line`](Self::next_line); the final `None` releases an
+    /// unterminated last line.  Feeding `None` again is a no-op.
+    pub(crate) fn feed(&mut self, chunk: Option<&[u8]>) {
+        match chunk {
+            Some(chunk) => self.extend(chunk),
+            None => self.finish(),
+        }
+    }
+
+    /// Append a network chunk, first discarding lines already handed out.
+    fn extend(&mut self, chunk: &[u8]) {
+        if self.start > 0 {
+            self.buf.drain(..self.start);
+            self.searched -= self.start;
+            self.start = 0;
+        }
+        self.buf.extend_from_slice(chunk);
+    }
+
+    /// Make an unterminated final line available to
+    /// [`next_line`](Self::next_line).
+    fn finish(&mut self) {
+        if self.start < self.buf.len() && self.buf.last() != Some(&b'\n') {
+            self.buf.push(b'\n');
+        }
+    }
+
+    /// Next complete line with the terminator and surrounding ASCII
+    /// whitespace (including `\r`) trimmed, or `None` if no full line is
+    /// buffered yet.
+    pub(crate) fn next_line(&mut self) -> Option<&[u8]> {
+        let from = self.searched.max(self.start);
+        match memchr::memchr(b'\n', &self.buf[from..]) {
+            Some(offset) => {
+                let line_start = self.start;
+                let nl = from + offset;
+                self.start = nl + 1;
+                self.searched = self.start;
+                Some(self.buf[line_start..nl].trim_ascii())
+            }
+            None => {
+                self.searched = self.buf.len();
+                None
+            }
+        }
+    }
+}
+
+// ── Tests ──────────────────────────────────────────────────────────────────────
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn drain(lines: &mut LineBuffer) -> Vec<Vec<u8>> {
+        let mut out = Vec::new();
+        while let Some(line) = lines.next_line() {
+            out.push(line.to_vec());
+        }
+        out
+    }
+
+    #[test]
+    fn yields_complete_lines_only() {
+        let mut lines = LineBuffer::new();
+        lines.feed(Some(b"{\"a\":1}\n{\"b\":"));
+        assert_eq!(drain(&mut lines), vec![b"{\"a\":1}".to_vec()]);
+        lines.feed(Some(b"2}\n"));
+        assert_eq!(drain(&mut lines), vec![b"{\"b\":2}".to_vec()]);
+        assert!(lines.next_line().is_none());
+    }
+
+    #[test]
+    fn rejoins_utf8_split_across_chunks() {
+        let bytes = "data: {\"content\":\"café\"}\n".as_bytes();
+        // Split inside the two-byte 'é'.
+        let split = bytes.iter().position(|&b| b == 0xC3).unwrap() + 1;
+        let mut lines = LineBuffer::new();
+        lines.feed(Some(&bytes[..split]));
+        assert!(lines.next_line().is_none());
+        lines.feed(Some(&bytes[split..]));
+        let line = lines.next_line().unwrap();
+        let data = line.strip_prefix(b"data: ").unwrap();
+        let json: serde_json::Value = serde_json::from_slice(data).unwrap();
+        assert_eq!(json["content"], "café");
+    }
+
+    #[test]
+    fn trims_crlf_and_blank_lines() {
+        let mut lines = LineBuffer::new();
+        lines.feed(Some(b"data: x\r\n\r\ndata: y\r\n"));
+        assert_eq!(
+            drain(&mut lines),
+            vec![b"data: x".to_vec(), b"".to_vec(), b"data: y".to_vec()]
+        );
+    }
+
+    #[test]
+    fn end_of_body_releases_unterminated_tail() {
+        let mut lines = LineBuffer::new();
+        lines.feed(Some(b"one\ntwo"));
+        assert_eq!(drain(&mut lines), vec![b"one".to_vec()]);
+        lines.feed(None);
+        assert_eq!(drain(&mut lines), vec![b"two".to_vec()]);
+        lines.feed(None);
+        assert!(lines.next_line().is_none());
+    }
+}
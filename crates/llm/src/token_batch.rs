@@ -0,0 +1,135 @@
+//! Coalescing of streamed tokens before they are sent to the consumer.
+//!
+//! Models can emit well over 100 tokens/s while the TUI repaints at ~60 Hz,
+//! so forwarding every token individually mostly buys consumer wake-ups and
+//! redraws nobody sees.  [`TokenBatcher`] groups tokens into small batches,
+//! flushing once a batch reaches [`MAX_BATCH_BYTES`] or has been held for
+//! [`MAX_BATCH_DELAY`] — including while the stream is stalled waiting for
+//! the next network chunk (see [`TokenBatcher::next_chunk`]).
+
+use std::time::Duration;
+
+use futures::{Stream, StreamExt};
+use tokio::time::Instant;
+
+/// Flush as soon as the pending batch holds this many bytes.
+pub(crate) const MAX_BATCH_BYTES: usize = 32;
+/// Never hold a non-empty batch longer than this (about one 60 Hz frame).
+pub(crate) const MAX_BATCH_DELAY: Duration = Duration::from_millis(16);
+
+// ── TokenBatcher ───────────────────────────────────────────────────────────────
+
+/// Size- and time-bounded token coalescer.
+///
+/// It only decides *when* a batch is ready; the caller yields or sends
+/// the batches it hands back.
+pub(crate) struct TokenBatcher {
+    buf: String,
+    last_flush: Instant,
+}
+
+/// Outcome of [`TokenBatcher::next_chunk`].
+pub(crate) enum Next<T> {
+    /// The body produced an item, or ended (`None`).
+    Chunk(Option<T>),
+    /// The pending batch reached its deadline before the body produced
+    /// anything; take it with [`TokenBatcher::take`].
+    Due,
+}
+
+impl TokenBatcher {
+    pub(crate) fn new() -> Self {
+        Self {
+            buf: String::new(),
+            last_flush: Instant::now(),
+        }
+    }
+
+    /// Queue `token`, returning the batch if it is full or has waited long
+    /// enough.
+    ///
+    /// The first token after a pause (normally including the very first one)
+    /// has already waited past the deadline, so it comes straight back.
+    pub(crate) fn push(&mut self, token: String) -> Option<String> {
+        if self.buf.is_empty() {
+            self.buf = token;
+        } else {
+            self.buf.push_str(&token);
+        }
+        if self.buf.len() >= MAX_BATCH_BYTES || self.last_flush.elapsed() >= MAX_BATCH_DELAY {
+            self.take()
+        } else {
+            None
+        }
+    }
+
+    /// Take whatever is pending.  Call once more after the stream ends.
+    pub(crate) fn take(&mut self) -> Option<String> {
+        self.last_flush = Instant::now();
+        (!self.buf.is_empty()).then(|| std::mem::take(&mut self.buf))
+    }
+
+    /// Receive the next body chunk, or report [`Next::Due`] if the pending
+    /// batch would otherwise outlive its deadline while the stream is idle.
+    pub(crate) async fn next_chunk<S>(&mut self, body: &mut S) -> Next<S::Item>
+    where
+        S: Stream + Unpin,
+    {
+        if self.buf.is_empty() {
+            return Next::Chunk(body.next().await);
+        }
+        let deadline = self.last_flush + MAX_BATCH_DELAY;
+        // Dropping a `next()` future leaves any in-flight read inside the
+        // stream itself, so timing out loses nothing.
+        match tokio::time::timeout_at(deadline, body.next()).await {
+            Ok(chunk) => Next::Chunk(chunk),
+            Err(_) => Next::Due,
+        }
+    }
+}
+
+// ── Tests ──────────────────────────────────────────────────────────────────────
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use tokio::sync::mpsc;
+
+    #[test]
+    fn coalesces_small_tokens_until_size_limit() {
+        let mut batch = TokenBatcher::new();
+        // Push the deadline out so only the size limit can trigger a flush.
+        batch.last_flush = Instant::now() + Duration::from_secs(60);
+        assert_eq!(batch.push("a".repeat(10)), None);
+        assert_eq!(batch.push("b".repeat(10)), None);
+        assert_eq!(batch.push("c".repeat(12)).unwrap().len(), 32);
+    }
+
+    #[test]
+    fn final_take_returns_remainder() {
+        let mut batch = TokenBatcher::new();
+        batch.last_flush = Instant::now() + Duration::from_secs(60);
+        assert_eq!(batch.push("tail".to_string()), None);
+        assert_eq!(batch.take().as_deref(), Some("tail"));
+        assert_eq!(batch.take(), None);
+    }
+
+    // Paused time auto-advances to the next timer, so the deadline always
+    // fires before the body's delayed send without any real waiting.
+    #[tokio::test(start_paused = true)]
+    async fn idle_stream_reports_due_after_deadline() {
+        let (body_tx, mut body_rx) = mpsc::channel::<u8>(1);
+        let mut body = futures::stream::poll_fn(move |cx| body_rx.poll_recv(cx));
+        let mut batch = TokenBatcher::new();
+        batch.last_flush = Instant::now();
+        assert_eq!(batch.push("held".to_string()), None);
+
+        tokio::spawn(async move {
+            tokio::time::sleep(MAX_BATCH_DELAY * 4).await;
+            let _ = body_tx.send(7).await;
+        });
+        assert!(matches!(batch.next_chunk(&mut body).await, Next::Due));
+        assert_eq!(batch.take().as_deref(), Some("held"));
+        assert!(matches!(batch.next_chunk(&mut body).await, Next::Chunk(Some(7))));
+    }
+}
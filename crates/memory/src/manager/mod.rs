@@ -978,30 +978,14 @@ impl MemoryManager {
     /// Falls back to generic placeholders when the entry is absent so the
     /// sleep prompt is always well-formed.
     fn bot_and_user_names_from_core(&self) -> (String, String) {
-        use std::sync::LazyLock;
-        use regex::Regex;
-        static RE_USER_NAME: LazyLock<Regex> = LazyLock::new(|| {
-            Regex::new(r"[Tt]he user(?:'s)? name is ([^.,\n]+)")
-                .expect("user name regex")
-        });
-        static RE_BOT_NAME: LazyLock<Regex> = LazyLock::new(|| {
-            Regex::new(r"^You are ([^,.\n]+)").expect("bot name regex")
-        });
-
         for entry in self.entries_by_tier(MemoryTier::Core) {
             if matches!(entry.source_kind(), SourceKind::OnboardingIdentity) {
-                let user_name = RE_USER_NAME
-                    .captures(&entry.content)
-                    .and_then(|c| c.get(1))
-                    .map(|m| m.as_str().trim().to_string())
-                    .filter(|s| !s.is_empty())
-                    .unwrap_or_else(|| "the user".to_string());
-                let bot_name = RE_BOT_NAME
-                    .captures(&entry.content)
-                    .and_then(|c| c.get(1))
-                    .map(|m| m.as_str().trim().to_string())
-                    .filter(|s| !s.is_empty())
-                    .unwrap_or_else(|| "the assistant".to_string());
+                let user_name = user_name_in_identity(&entry.content)
+                    .unwrap_or("the user")
+                    .to_string();
+                let bot_name = bot_name_in_identity(&entry.content)
+                    .unwrap_or("the assistant")
+                    .to_string();
                 return (bot_name, user_name);
             }
         }
@@ -1208,6 +1192,40 @@ async fn retire_core_by_prefix(
     Ok(())
 }
 
+/// The name that opens `text`, up to the first `.`, `,` or newline.
+fn leading_name(text: &str) -> Option<&str> {
+    let name = text.split(['.', ',', '\n']).next()?.trim();
+    (!name.is_empty()).then_some(name)
+}
+
+/// Bot name from the seeded identity sentence `"You are <name>, …"`.
+fn bot_name_in_identity(content: &str) -> Option<&str> {
+    leading_name(content.strip_prefix("You are ")?)
+}
+
+/// User name from the first `"[Tt]he user['s] name is <name>"` phrase.
+///
+/// A phrase followed directly by `.`, `,`, a newline or the end of the text
+/// names nobody and is skipped, so a later phrase can still supply the name.
+pub(super) fn user_name_in_identity(content: &str) -> Option<&str> {
+    const MARKERS: [&str; 4] = [
+        "The user's name is ",
+        "the user's name is ",
+        "The user name is ",
+        "the user name is ",
+    ];
+    let mut rest = content;
+    loop {
+        let (idx, marker) = MARKERS
+            .iter()
+            .filter_map(|marker| rest.find(marker).map(|idx| (idx, marker)))
+            .min_by_key(|&(idx, _)| idx)?;
+        rest = &rest[idx + marker.len()..];
+        if rest.starts_with(|c: char| !matches!(c, '.' | ',' | '\n')) {
+            return leading_name(rest);
+        }
+    }
+}
 
 #[cfg(test)]
 mod tests {
@@ -1219,6 +1237,7 @@ mod tests {
     use uuid::Uuid;
 
     use super::vault_sync::derive_default_vault_path;
+    use super::{bot_name_in_identity, user_name_in_identity};
     use crate::event_log::{MemoryEventLog, MemoryRecordEvent};
     use crate::manager::MemoryManager;
     use crate::schema::{MemoryEntry, MemoryTier, SourceKind};
@@ -1343,6 +1362,22 @@ mod tests {
         Ok(())
     }
 
+    #[test]
+    fn extracts_names_from_identity_sentence() {
+        let seeded = "You are Aigent, a helpful and truthful AI companion. \
+                      The user's name is Ada Lovelace. Be kind.";
+        assert_eq!(bot_name_in_identity(seeded), Some("Aigent"));
+        assert_eq!(user_name_in_identity(seeded), Some("Ada Lovelace"));
+        assert_eq!(user_name_in_identity("Note: the user name is Bob\nmore"), Some("Bob"));
+        assert_eq!(bot_name_in_identity("Hello. You are X."), None);
+        assert_eq!(bot_name_in_identity("You are , nobody"), None);
+        assert_eq!(user_name_in_identity("no names here"), None);
+        assert_eq!(
+            user_name_in_identity("The user's name is . The user's name is Grace."),
+            Some("Grace")
+        );
+    }
+
     #[test]
     fn derives_default_vault_path_for_standard_event_log_location() {
         let event_log = Path::new(".aigent/memory/events.jsonl");
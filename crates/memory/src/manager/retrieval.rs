@@ -7,7 +7,7 @@ use crate::retrieval::{RankedMemoryContext, assemble_context_with_provenance};
 use crate::schema::{MemoryEntry, MemoryTier};
 use crate::vault::read_kv_for_injection;
 
-use super::{MemoryManager, contains_icase, strip_tag_prefix_lower};
+use super::{MemoryManager, contains_icase, strip_tag_prefix_lower, user_name_in_identity};
 
 impl MemoryManager {
     pub fn context_for_prompt(&self, limit: usize) -> Vec<MemoryEntry> {
@@ -242,16 +242,10 @@ impl MemoryManager {
 
     /// Extract the user's first name from the canonical Core identity entry.
     pub fn user_name_from_core(&self) -> Option<String> {
-        for entry in self.entries_by_tier(MemoryTier::Core) {
-            if let Some(idx) = entry.content.find("The user's name is ") {
-                let after = &entry.content[idx + "The user's name is ".len()..];
-                let name = after.split(['.', ',', '\n']).next()?.trim().to_string();
-                if !name.is_empty() {
-                    return Some(name);
-                }
-            }
-        }
-        None
+        self.entries_by_tier(MemoryTier::Core)
+            .into_iter()
+            .find_map(|entry| user_name_in_identity(&entry.content))
+            .map(str::to_string)
     }
 
 }
@@ -259,15 +259,21 @@ fn extract_topics(content: &str) -> Vec<String> {
         .collect()
 }
 
+/// Map `raw` to `[A-Za-z0-9-]`, collapsing separator runs and trimming
+/// them from both ends, in a single pass.
 fn sanitize_topic_slug(raw: &str) -> String {
-    let mut slug = raw
-        .chars()
-        .map(|ch| if ch.is_ascii_alphanumeric() { ch } else { '-' })
-        .collect::<String>();
-    while slug.contains("--") {
-        slug = slug.replace("--", "-");
+    let mut slug = String::with_capacity(raw.len());
+    for ch in raw.chars() {
+        if ch.is_ascii_alphanumeric() {
+            slug.push(ch);
+        } else if !slug.is_empty() && !slug.ends_with('-') {
+            slug.push('-');
+        }
+    }
+    if slug.ends_with('-') {
+        slug.pop();
     }
-    slug.trim_matches('-').to_string()
+    slug
 }
 
 // ── YAML KV summary helpers ───────────────────────────────────────────────────
@@ -275,24 +281,48 @@ fn sanitize_topic_slug(raw: &str) -> String {
 /// Escape an arbitrary string as a YAML double-quoted scalar.
 /// Handles backslashes, double-quotes, newlines, and carriage returns.
 fn yaml_quote(s: &str) -> String {
-    let escaped = s
-        .replace('\\', "\\\\")
-        .replace('"', "\\\"")
-        .replace('\n', "\\n")
-        .replace('\r', "");
-    format!("\"{escaped}\"")
+    let mut out = String::with_capacity(s.len() + 2);
+    out.push('"');
+    for c in s.chars() {
+        match c {
+            '\\' => out.push_str("\\\\"),
+            '"' => out.push_str("\\\""),
+            '\n' => out.push_str("\\n"),
+            '\r' => {}
+            c => out.push(c),
+        }
+    }
+    out.push('"');
+    out
 }
 
 /// Un-escape a YAML double-quoted scalar (strips outer quotes, reverses escapes).
+///
+/// Escapes are decoded left to right in one pass, so an escaped backslash
+/// followed by `n` stays a literal `\n` instead of turning into a space.
 fn unyaml_quote(s: &str) -> String {
-    if s.starts_with('"') && s.ends_with('"') && s.len() >= 2 {
-        s[1..s.len() - 1]
-            .replace("\\\"", "\"")
-            .replace("\\\\", "\\")
-            .replace("\\n", " ")
-    } else {
-        s.to_string()
+    let Some(inner) = s.strip_prefix('"').and_then(|s| s.strip_suffix('"')) else {
+        return s.to_string();
+    };
+    let mut out = String::with_capacity(inner.len());
+    let mut chars = inner.chars();
+    while let Some(c) = chars.next() {
+        if c != '\\' {
+            out.push(c);
+            continue;
+        }
+        match chars.next() {
+            Some('"') => out.push('"'),
+            Some('\\') => out.push('\\'),
+            Some('n') => out.push(' '),
+            Some(other) => {
+                out.push('\\');
+                out.push(other);
+            }
+            None => out.push('\\'),
+        }
     }
+    out
 }
 
 /// Compute the SHA-256 hex digest of a UTF-8 string.
@@ -305,14 +335,22 @@ fn sha256_of(s: &str) -> String {
 /// Write `content` to `path` only when the file's current on-disk content
 /// differs.  Creates parent directories as needed.
 /// Returns `true` when the file was written; `false` when it was skipped.
+///
+/// A length mismatch (from metadata alone) proves a change without reading
+/// the file; only same-length files are read, and compared as raw bytes.
 fn write_file_if_changed(path: &Path, content: &str) -> Result<bool> {
-    if path.exists() {
-        let existing = fs::read_to_string(path)?;
-        if existing == content {
-            return Ok(false);
+    match fs::metadata(path) {
+        Ok(meta) => {
+            if meta.len() == content.len() as u64 && fs::read(path)? == content.as_bytes() {
+                return Ok(false);
+            }
+        }
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+            if let Some(parent) = path.parent() {
+                fs::create_dir_all(parent)?;
+            }
         }
-    } else if let Some(parent) = path.parent() {
-        fs::create_dir_all(parent)?;
+        Err(e) => return Err(e.into()),
     }
     fs::write(path, content)?;
     Ok(true)
@@ -785,3 +823,25 @@ pub fn spawn_vault_watcher(
         }
     })
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn yaml_quote_round_trips_escapes() {
+        let quoted = yaml_quote("say \"hi\"\r\nC:\\new");
+        assert_eq!(quoted, r#""say \"hi\"\nC:\\new""#);
+        // Newlines fold to spaces; the escaped backslash before `new` stays.
+        assert_eq!(unyaml_quote(&quoted), "say \"hi\" C:\\new");
+        assert_eq!(unyaml_quote("bare"), "bare");
+        assert_eq!(unyaml_quote("\""), "\"");
+    }
+
+    #[test]
+    fn topic_slug_collapses_and_trims_separators() {
+        assert_eq!(sanitize_topic_slug("rust"), "rust");
+        assert_eq!(sanitize_topic_slug("--café  résumé!!"), "caf-r-sum");
+        assert_eq!(sanitize_topic_slug("***"), "");
+    }
+}
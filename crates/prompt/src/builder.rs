@@ -165,7 +165,27 @@ pub fn build_chat_prompt(inputs: &PromptInputs<'_>) -> String {
         String::new()
     };
 
-    let mut buf = String::with_capacity(8192);
+    // Size the buffer from the sections up front so the single `write!`
+    // below never has to reallocate and copy the (often 30 KB+) prompt.
+    const TEMPLATE_CHARS: usize = 2048;
+    let mut buf = String::with_capacity(
+        TEMPLATE_CHARS
+            + config.agent.name.len()
+            + thought_style.len()
+            + relational_block.len()
+            + proactive_directive.len()
+            + inputs.identity_block.len()
+            + inputs.beliefs_block.len()
+            + tools_section.len()
+            + ext_think_block.len()
+            + current_datetime.len()
+            + follow_up_block.len()
+            + environment_block.len()
+            + prior_summary.len()
+            + conversation_block.len()
+            + context_block.len()
+            + response_tag.len(),
+    );
     let _ = write!(
         buf,
         // ── Static prefix ────────────────────────────────────────────
@@ -240,21 +260,29 @@ fn build_follow_up_block(follow_ups: &[(Uuid, String)], user_name: Option<&str>)
     if follow_ups.is_empty() {
         return String::new();
     }
-    let items = follow_ups
-        .iter()
-        .map(|(_, text)| format!("- {text}"))
-        .collect::<Vec<_>>()
-        .join("\n");
     let user_name = user_name.unwrap_or("the user");
-    format!(
-        "\n\nPENDING FOLLOW-UPS (things you wanted to raise with {user_name}):\n\
-         {items}\n\
-         [If appropriate, acknowledge these naturally at the start of your response.]"
-    )
+    let items_len: usize = follow_ups.iter().map(|(_, text)| text.len() + 3).sum();
+    let mut block = String::with_capacity(items_len + 160);
+    let _ = writeln!(
+        block,
+        "\n\nPENDING FOLLOW-UPS (things you wanted to raise with {user_name}):"
+    );
+    for (_, text) in follow_ups {
+        let _ = writeln!(block, "- {text}");
+    }
+    block.push_str(
+        "[If appropriate, acknowledge these naturally at the start of your response.]",
+    );
+    block
 }
 
 fn build_context_block(context: &[RankedMemoryContext], stats: &MemoryStats, lc: &LearningConfig) -> String {
-    let memory_header = format!(
+    // Items are written straight into one buffer sized for the header plus
+    // every item's content and per-line decoration.
+    let items_len: usize = context.iter().map(|item| item.entry.content.len() + 96).sum();
+    let mut block = String::with_capacity(160 + items_len);
+    let _ = write!(
+        block,
         "[Memory: total={} core={} profile={} reflective={} semantic={} episodic={} \
          — use these counts; do not re-count below]",
         stats.total,
@@ -265,29 +293,24 @@ fn build_context_block(context: &[RankedMemoryContext], stats: &MemoryStats, lc:
         stats.episodic,
     );
 
-    if context.is_empty() {
-        return format!("{memory_header}\n(no relevant memories retrieved)");
+    let mut any_rendered = false;
+    for item in context {
+        let Some(rendered) = render_memory_item(item, lc) else { continue };
+        any_rendered = true;
+        let _ = write!(
+            block,
+            "\n- [{:?}] score={:.2} src={} :: {}",
+            item.entry.tier,
+            item.score,
+            item.entry.source,
+            rendered,
+        );
     }
 
-    let items: Vec<String> = context
-        .iter()
-        .filter_map(|item| {
-            let rendered = render_memory_item(item, lc)?;
-            Some(format!(
-                "- [{:?}] score={:.2} src={} :: {}",
-                item.entry.tier,
-                item.score,
-                item.entry.source,
-                rendered,
-            ))
-        })
-        .collect();
-
-    if items.is_empty() {
-        return format!("{memory_header}\n(no relevant memories retrieved)");
+    if !any_rendered {
+        block.push_str("\n(no relevant memories retrieved)");
     }
-
-    format!("{memory_header}\n{}", items.join("\n"))
+    block
 }
 
 /// Render a memory item's content with calibrated epistemic language based on
@@ -404,33 +427,34 @@ fn build_environment_block(
 fn build_conversation_block(recent_turns: &[ConversationTurn]) -> String {
     let start = recent_turns.len().saturating_sub(6);
     let window = &recent_turns[start..];
-    let window_len = window.len();
-    let formatted = window
-        .iter()
-        .enumerate()
-        .map(|(index, turn)| {
-            // Give the most recent 2 turns a larger truncation limit so
-            // the model has full context for follow-up / pronoun resolution.
-            let limit = if index >= window_len.saturating_sub(2) { 8192 } else { 4096 };
-            format!(
-                "Turn {}\nUser: {}\nAssistant: {}",
-                index + 1,
-                truncate_for_prompt(&turn.user, limit),
-                truncate_for_prompt(&turn.assistant, limit),
-            )
-        })
-        .collect::<Vec<_>>()
-        .join("\n\n");
+    if window.is_empty() {
+        return "(none yet)".to_string();
+    }
 
-    if formatted.is_empty() {
-        "(none yet)".to_string()
-    } else {
-        format!(
-            "[The last 2-3 turns are your PRIMARY context for understanding the user's current intent. \
-             Resolve all pronouns and implicit references from these turns.]\n\n\
-             {formatted}"
-        )
+    let mut block = String::with_capacity(
+        256 + window
+            .iter()
+            .map(|turn| turn.user.len() + turn.assistant.len() + 40)
+            .sum::<usize>(),
+    );
+    block.push_str(
+        "[The last 2-3 turns are your PRIMARY context for understanding the user's current intent. \
+         Resolve all pronouns and implicit references from these turns.]",
+    );
+    let recent_from = window.len().saturating_sub(2);
+    for (index, turn) in window.iter().enumerate() {
+        // Give the most recent 2 turns a larger truncation limit so
+        // the model has full context for follow-up / pronoun resolution.
+        let limit = if index >= recent_from { 8192 } else { 4096 };
+        let _ = write!(
+            block,
+            "\n\nTurn {}\nUser: {}\nAssistant: {}",
+            index + 1,
+            truncate_for_prompt(&turn.user, limit),
+            truncate_for_prompt(&turn.assistant, limit),
+        );
     }
+    block
 }
 
 /// Build the tools listing + grounding / truth-seeking rules.
@@ -798,7 +822,7 @@ mod confidence_tier_rendering {
     use uuid::Uuid;
     use aigent_memory::{BeliefKind, MemoryEntry, MemoryTier, retrieval::RankedMemoryContext};
 
-    fn make_item(content: &str, belief_kind: BeliefKind, live_confidence: f32) -> RankedMemoryContext {
+    pub(super) fn make_item(content: &str, belief_kind: BeliefKind, live_confidence: f32) -> RankedMemoryContext {
         RankedMemoryContext {
             entry: MemoryEntry {
                 id: Uuid::new_v4(),
@@ -889,3 +913,57 @@ mod confidence_tier_rendering {
         assert!(rendered.contains("skepticism"), "should mention skepticism");
     }
 }
+
+#[cfg(test)]
+mod block_builders {
+    use super::*;
+    use super::confidence_tier_rendering::make_item;
+    use aigent_memory::BeliefKind;
+    use uuid::Uuid;
+
+    #[test]
+    fn context_block_lists_rendered_items_and_skips_excluded() {
+        let items = vec![
+            make_item("Rust uses a borrow checker.", BeliefKind::Empirical, 0.75),
+            make_item("Maybe the API is broken.", BeliefKind::Empirical, 0.09),
+        ];
+        let block = build_context_block(&items, &MemoryStats::default(), &LearningConfig::default());
+        let lines: Vec<&str> = block.lines().collect();
+        assert_eq!(lines.len(), 2, "header + one rendered item, got: {block}");
+        assert!(lines[0].starts_with("[Memory: total=0"));
+        assert!(lines[1].starts_with("- [Episodic] score=0.50 src=test :: You know that"));
+
+        let excluded = vec![make_item("Maybe the API is broken.", BeliefKind::Empirical, 0.09)];
+        let block = build_context_block(&excluded, &MemoryStats::default(), &LearningConfig::default());
+        assert!(block.ends_with("]\n(no relevant memories retrieved)"));
+    }
+
+    #[test]
+    fn follow_up_block_lists_each_item() {
+        let follow_ups = vec![(Uuid::new_v4(), "ask about the trip".to_string())];
+        let block = build_follow_up_block(&follow_ups, Some("Sam"));
+        assert_eq!(
+            block,
+            "\n\nPENDING FOLLOW-UPS (things you wanted to raise with Sam):\n\
+             - ask about the trip\n\
+             [If appropriate, acknowledge these naturally at the start of your response.]"
+        );
+    }
+
+    #[test]
+    fn conversation_block_keeps_last_six_turns() {
+        assert_eq!(build_conversation_block(&[]), "(none yet)");
+
+        let turns: Vec<ConversationTurn> = (1..=8)
+            .map(|i| ConversationTurn {
+                user: format!("u{i}").into(),
+                assistant: format!("a{i}").into(),
+            })
+            .collect();
+        let block = build_conversation_block(&turns);
+        assert!(block.starts_with("[The last 2-3 turns are your PRIMARY context"));
+        assert!(block.contains("]\n\nTurn 1\nUser: u3\nAssistant: a3\n\nTurn 2\nUser: u4"));
+        assert!(block.ends_with("Turn 6\nUser: u8\nAssistant: a8"));
+        assert!(!block.contains("u2"));
+    }
+}
@@ -19,16 +19,22 @@ pub mod truncate;
 pub use builder::build_chat_prompt;
 pub use truncate::truncate_for_prompt;
 
+use std::sync::Arc;
+
 use aigent_memory::{MemoryStats, retrieval::RankedMemoryContext};
 use uuid::Uuid;
 
 // ─── types ───────────────────────────────────────────────────────────────────
 
 /// A single user↔assistant exchange in conversation history.
+///
+/// The text is held in shared `Arc<str>` buffers: history is snapshotted on
+/// every turn (prompt assembly, summarization), and cloning a turn is then
+/// two refcount bumps instead of two string copies.
 #[derive(Debug, Clone)]
 pub struct ConversationTurn {
-    pub user: String,
-    pub assistant: String,
+    pub user: Arc<str>,
+    pub assistant: Arc<str>,
 }
 
 /// All pre-computed data needed to assemble the final LLM prompt.
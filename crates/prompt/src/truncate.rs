@@ -1,13 +1,21 @@
 //! Text-truncation utility shared across the codebase.
 
+use std::borrow::Cow;
+
 /// Truncate `text` to at most `max_chars` characters, appending `…` when cut.
-pub fn truncate_for_prompt(text: &str, max_chars: usize) -> String {
-    let chars = text.chars().collect::<Vec<_>>();
-    if chars.len() <= max_chars {
-        return text.to_string();
+///
+/// Text that already fits is returned borrowed, so the common case costs no
+/// allocation; only a cut produces an owned `String` (prefix plus `…`).
+pub fn truncate_for_prompt(text: &str, max_chars: usize) -> Cow<'_, str> {
+    match text.char_indices().nth(max_chars) {
+        None => Cow::Borrowed(text),
+        Some((cut, _)) => {
+            let mut out = String::with_capacity(cut + '…'.len_utf8());
+            out.push_str(&text[..cut]);
+            out.push('…');
+            Cow::Owned(out)
+        }
     }
-    let truncated: String = chars.into_iter().take(max_chars).collect();
-    format!("{truncated}…")
 }
 
 #[cfg(test)]
@@ -17,6 +25,7 @@ mod tests {
     #[test]
     fn short_text_unchanged() {
         assert_eq!(truncate_for_prompt("hello", 10), "hello");
+        assert!(matches!(truncate_for_prompt("hello", 10), Cow::Borrowed(_)));
     }
 
     #[test]
@@ -9,7 +9,7 @@ use chrono::{Local, Utc};
 use serde::{Deserialize, Serialize};
 use std::{
     fs,
-    io::{BufRead, BufReader, Write},
+    io::{ErrorKind, Write},
     path::{Path, PathBuf},
 };
 
@@ -74,22 +74,29 @@ pub fn append_turn(role: impl Into<String>, content: impl Into<String>) -> Resul
 /// If the file doesn't exist, returns an empty `Vec`.
 pub fn load_recent(max_turns: usize) -> Result<Vec<TurnRecord>> {
     let path = history_file_path();
-    if !path.exists() {
-        return Ok(vec![]);
-    }
-    let file = fs::File::open(&path)
-        .with_context(|| format!("open history file {}", path.display()))?;
-    let reader = BufReader::new(file);
+    // One read of the whole file; a missing file is the normal first-run
+    // case, so it is detected from the open error rather than a prior stat.
+    let bytes = match fs::read(&path) {
+        Ok(bytes) => bytes,
+        Err(e) if e.kind() == ErrorKind::NotFound => return Ok(vec![]),
+        Err(e) => {
+            return Err(e).with_context(|| format!("read history file {}", path.display()));
+        }
+    };
+    Ok(parse_recent(&bytes, max_turns))
+}
 
-    let mut records: Vec<TurnRecord> = reader
-        .lines()
+/// Parse JSONL history, skipping blank or malformed lines, and keep only
+/// the last `max_turns` records.
+fn parse_recent(bytes: &[u8], max_turns: usize) -> Vec<TurnRecord> {
+    let mut records: Vec<TurnRecord> = bytes
+        .split(|&b| b == b'\n')
         .filter_map(|line| {
-            let line = line.ok()?;
-            let trimmed = line.trim();
+            let trimmed = line.trim_ascii();
             if trimmed.is_empty() {
                 return None;
             }
-            serde_json::from_str(trimmed).ok()
+            serde_json::from_slice(trimmed).ok()
         })
         .collect();
 
@@ -98,28 +105,31 @@ pub fn load_recent(max_turns: usize) -> Result<Vec<TurnRecord>> {
         let skip = records.len() - max_turns;
         records.drain(..skip);
     }
-    Ok(records)
+    records
 }
 
 /// Delete today's history file.
 pub fn clear_history() -> Result<()> {
     let path = history_file_path();
-    if path.exists() {
-        fs::remove_file(&path)
-            .with_context(|| format!("remove history file {}", path.display()))?;
+    match fs::remove_file(&path) {
+        Err(e) if e.kind() != ErrorKind::NotFound => {
+            Err(e).with_context(|| format!("remove history file {}", path.display()))
+        }
+        _ => Ok(()),
     }
-    Ok(())
 }
 
 /// Copy today's history file to `dest`.
 pub fn export_history(dest: &Path) -> Result<()> {
     let path = history_file_path();
-    if !path.exists() {
-        anyhow::bail!("no history for today ({} does not exist)", path.display());
+    match fs::copy(&path, dest) {
+        Ok(_) => Ok(()),
+        Err(e) if e.kind() == ErrorKind::NotFound && !path.exists() => {
+            anyhow::bail!("no history for today ({} does not exist)", path.display())
+        }
+        Err(e) => Err(e)
+            .with_context(|| format!("copy {} -> {}", path.display(), dest.display())),
     }
-    fs::copy(&path, dest)
-        .with_context(|| format!("copy {} -> {}", path.display(), dest.display()))?;
-    Ok(())
 }
 
 // ── Tests ────────────────────────────────────────────────────────────────────
@@ -127,6 +137,7 @@ pub fn export_history(dest: &Path) -> Result<()> {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use std::io::BufRead;
 
     #[test]
     fn turn_record_serde_roundtrip() {
@@ -318,4 +329,24 @@ mod tests {
             .collect();
         assert_eq!(records.len(), 2);
     }
+
+    #[test]
+    fn parse_recent_skips_bad_lines_and_keeps_tail() {
+        let mut content = String::new();
+        for i in 0..4 {
+            let r = TurnRecord {
+                role: "user".into(),
+                content: format!("msg {i}"),
+                timestamp: Utc::now(),
+            };
+            content.push_str(&serde_json::to_string(&r).unwrap());
+            content.push_str(if i == 1 { "\r\n\nnot json\n" } else { "\n" });
+        }
+
+        let records = parse_recent(content.as_bytes(), 3);
+        assert_eq!(records.len(), 3);
+        assert_eq!(records[0].content, "msg 1");
+        assert_eq!(records[2].content, "msg 3");
+        assert!(parse_recent(b"", 3).is_empty());
+    }
 }
@@ -188,8 +188,8 @@ pub(super) async fn handle_connection(
                 // Build the messages array: system + history + current user turn.
                 let mut messages = vec![aigent_llm::ChatMessage::system(&system_prompt)];
                 for turn in &recent {
-                    messages.push(aigent_llm::ChatMessage::user(&turn.user));
-                    messages.push(aigent_llm::ChatMessage::assistant(&turn.assistant));
+                    messages.push(aigent_llm::ChatMessage::user(&*turn.user));
+                    messages.push(aigent_llm::ChatMessage::assistant(&*turn.assistant));
                 }
                 messages.push(aigent_llm::ChatMessage::user(&user));
 
@@ -240,7 +240,7 @@ pub(super) async fn handle_connection(
                     let mut s = state.lock().await;
 
                     let reply_result: Result<String, anyhow::Error> = match loop_result {
-                        Ok(ref result) => {
+                        Ok(result) => {
                             // Record tool invocations to Episodic memory so
                             // the sleep cycle can distill procedural patterns.
                             // Raw tool logs belong in Episodic (transient);
@@ -259,11 +259,13 @@ pub(super) async fn handle_connection(
                                     exec.duration_ms,
                                     safe_truncate(&exec.output, 400),
                                 );
-                                let _: Result<_, _> = s.memory.record(
+                                if let Err(err) = s.memory.record(
                                     MemoryTier::Episodic,
                                     episodic_text,
                                     format!("tool-log:{}", exec.tool_name),
-                                ).await;
+                                ).await {
+                                    warn!(?err, "post-turn memory record failed");
+                                }
 
                                 // Pain hook: failed tools → immediate Procedural signal.
                                 if !exec.success {
@@ -272,35 +274,41 @@ pub(super) async fn handle_connection(
                                         exec.tool_name,
                                         safe_truncate(&exec.output, 200),
                                     );
-                                    let _: Result<_, _> = s.memory.record(
+                                    if let Err(err) = s.memory.record(
                                         MemoryTier::Procedural,
                                         pain_text,
                                         format!("tool-failure:{}", exec.tool_name),
-                                    ).await;
+                                    ).await {
+                                        warn!(?err, "post-turn memory record failed");
+                                    }
                                 }
                             }
                             // Record assistant reply
                             if !result.content.is_empty() {
                                 let model_tag = rt_clone.config.active_model().to_string();
-                                let _: Result<_, _> = s.memory.record(
+                                if let Err(err) = s.memory.record(
                                     aigent_memory::MemoryTier::Episodic,
-                                    aigent_prompt::truncate_for_prompt(&result.content, 1024),
+                                    aigent_prompt::truncate_for_prompt(&result.content, 1024).into_owned(),
                                     format!("assistant-reply:model={}", model_tag),
-                                ).await;
+                                ).await {
+                                    warn!(?err, "post-turn memory record failed");
+                                }
                             }
                             // Persist reasoning traces when enabled.
                             if rt_clone.config.memory.store_reasoning_traces {
                                 for trace in &result.reasoning_traces {
                                     if !trace.is_empty() {
-                                        let _: Result<_, _> = s.memory.record(
+                                        if let Err(err) = s.memory.record(
                                             aigent_memory::MemoryTier::Reflective,
-                                            aigent_prompt::truncate_for_prompt(trace, 500),
+                                            aigent_prompt::truncate_for_prompt(trace, 500).into_owned(),
                                             "agent-reasoning".to_string(),
-                                        ).await;
+                                        ).await {
+                                            warn!(?err, "post-turn memory record failed");
+                                        }
                                     }
                                 }
                             }
-                            Ok(result.content.clone())
+                            Ok(result.content)
                         }
                         Err(e) => Err(e),
                     };
@@ -323,14 +331,16 @@ pub(super) async fn handle_connection(
                         }
                     };
 
-                    let _ = s.memory.flush_all();
+                    // Writes the user-input record, the records above and any
+                    // reflection writes to the vault.
+                    spawn_vault_flush(state.clone());
 
                     match reply_result {
                         Ok(reply) => {
                             s.last_turn_at = Some(Utc::now());
                             s.recent_turns.push_back(ConversationTurn {
-                                user: user.clone(),
-                                assistant: reply,
+                                user: user.as_str().into(),
+                                assistant: reply.into(),
                             });
                             s.turn_count += 1;
 
@@ -872,6 +882,24 @@ pub(super) async fn handle_connection(
     Ok(())
 }
 
+// ── Post-turn persistence ─────────────────────────────────────────────────────
+
+/// Flush a finished turn's memories to the vault on a detached task.
+///
+/// The turn's records are already in the in-memory store, so the vault
+/// projection is the only write kept off the user-visible path:
+/// `handle_connection` can send `Done` as soon as the conversation buffer is
+/// updated.  No ordering against other post-turn tasks is needed — a
+/// background sleep cycle that takes the lock first flushes the same state.
+fn spawn_vault_flush(state: Arc<Mutex<DaemonState>>) {
+    tokio::spawn(async move {
+        let mut s = state.lock().await;
+        if let Err(err) = s.memory.flush_all() {
+            warn!(?err, "post-turn memory flush failed");
+        }
+    });
+}
+
 async fn send_event(
     writer: &mut tokio::net::unix::OwnedWriteHalf,
     event: ServerEvent,
@@ -449,8 +449,8 @@ pub(super) fn spawn_proactive_task(
 
             let mut messages = vec![aigent_llm::ChatMessage::system(&system_prompt)];
             for turn in &recent {
-                messages.push(aigent_llm::ChatMessage::user(&turn.user));
-                messages.push(aigent_llm::ChatMessage::assistant(&turn.assistant));
+                messages.push(aigent_llm::ChatMessage::user(&*turn.user));
+                messages.push(aigent_llm::ChatMessage::assistant(&*turn.assistant));
             }
             messages.push(aigent_llm::ChatMessage::user(proactive_user_msg));
 
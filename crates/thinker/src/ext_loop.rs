@@ -20,9 +20,10 @@
 //! The loop supports chained tool calls (e.g. `web_search` → `browse_page`
 //! → `final_answer`).  Each iteration:
 //!
-//! 1. Calls the LLM with a **drain channel** (tokens are absorbed, not shown).
+//! 1. Calls the LLM through the non-streaming chat API (no tokens are shown
+//!    to the user until a step has been parsed).
 //! 2. Parses from `response.content` — the authoritative complete output
-//!    accumulated by the LLM client — avoiding any streaming race conditions.
+//!    returned by the LLM client — avoiding any streaming race conditions.
 //! 3. Dispatches the parsed step (emit thought, execute tool, or return answer).
 //! 4. Appends the assistant reply + tool observation to `messages` and loops.
 
@@ -112,32 +113,18 @@ pub async fn run_external_thinking_loop(
         }
         debug!(round, "external thinking loop iteration");
 
-        // ── Call the LLM (streaming, no native tools) ────────────────────
+        // ── Call the LLM (non-streaming, no native tools) ────────────────
         //
-        // We supply a *drain* channel that silently absorbs the raw streamed
-        // tokens.  We do NOT parse from the stream — instead we parse from
-        // `response.content`, which the LLM client accumulates internally
-        // and returns as one complete string.
-        //
-        // This avoids all race conditions between the spawned drain task and
-        // the LLM future: there is no early-break, no partial `raw_all`,
-        // and no risk of discarding buffered tokens.
-        let (drain_tx, mut drain_rx) = mpsc::channel::<String>(512);
-
-        // Spawn a lightweight task to consume tokens so `tx.send()` inside
-        // the LLM never blocks.  The task ends naturally once the sender is
-        // dropped (i.e. after llm_fut completes).
-        let drain_handle = tokio::spawn(async move {
-            while drain_rx.recv().await.is_some() {}
-        });
-
-        let llm_fut = llm.chat_messages_stream(
+        // Nothing here consumes individual tokens — we parse from the
+        // complete `response.content` — so the non-streaming chat API is
+        // used directly.  A streaming call would pay a channel send (plus a
+        // consumer-task wakeup) per token only to throw every token away.
+        let llm_fut = llm.chat_messages(
             primary,
             ollama_model,
             openrouter_model,
             messages,
             None,   // no native tool schemas — the JSON prompt handles dispatch
-            drain_tx,
             false,
             true,   // always suppress native thinking — ext_loop IS the thinking mechanism
         );
@@ -152,14 +139,19 @@ pub async fn run_external_thinking_loop(
             }
         };
 
-        // Ensure the drain task finishes (the sender was dropped when
-        // llm_fut completed, so this is nearly instantaneous).
-        let _ = drain_handle.await;
+        // The non-streaming clients report transport failures (e.g. Ollama
+        // not running) as `finish_reason == "error"` rather than `Err`.
+        // Retrying will never help, and the error text must not be mistaken
+        // for a plain-text reply, so abort the loop.
+        if response.finish_reason == "error" {
+            warn!(round, error = %response.content, "LLM provider error — aborting ext_loop");
+            bail!("LLM provider error: {}", response.content);
+        }
 
         // ── Parse from the authoritative response.content ────────────────
         //
-        // `response.content` is the full text accumulated by the LLM client
-        // during streaming.  Parsing from this single complete string avoids
+        // `response.content` is the full text returned by the LLM client.
+        // Parsing from this single complete string avoids
         // every partial-data and race-condition bug that plagued the old
         // approach of parsing from the intercepted stream.
         let full_text = response.content.clone();
@@ -11,7 +11,7 @@
 //!         ├─ build_external_thinking_block() ← thinker::prompt
 //!         └─ run_external_thinking_loop()    ← thinker::ext_loop
 //!               │
-//!               ├─ LlmRouter::chat_messages_stream()  (aigent-llm)
+//!               ├─ LlmRouter::chat_messages()         (aigent-llm)
 //!               ├─ ToolExecutor::execute()             (aigent-exec)
 //!               └─ emits ThinkerEvent via EventSink   (thinker::events)
 //! ```
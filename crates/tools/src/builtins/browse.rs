@@ -11,6 +11,7 @@
 //! * Private IP blocking for security.
 //! * Rich structured output with title, content, word_count, published_date.
 
+use std::borrow::Cow;
 use std::collections::HashMap;
 use std::net::{IpAddr, ToSocketAddrs};
 use std::time::Duration;
@@ -48,6 +49,77 @@ const MAX_BATCH_URLS: usize = 5;
 static PAGE_CACHE: std::sync::LazyLock<TtlCache> =
     std::sync::LazyLock::new(|| TtlCache::new(128, Duration::from_secs(600)));
 
+// ─── Selectors ───────────────────────────────────────────────────────────────
+//
+// All CSS selectors are fixed, so they are parsed once on first use rather
+// than on every page extraction.
+
+/// Parse a built-in CSS selector; these are constants, so failure is a bug.
+pub(super) fn static_selector(css: &str) -> Selector {
+    Selector::parse(css).unwrap_or_else(|e| panic!("invalid built-in selector {css:?}: {e}"))
+}
+
+static SEL_TITLE: std::sync::LazyLock<Selector> =
+    std::sync::LazyLock::new(|| static_selector("title"));
+static SEL_META: std::sync::LazyLock<Selector> =
+    std::sync::LazyLock::new(|| static_selector("meta"));
+static SEL_META_DESCRIPTION: std::sync::LazyLock<Selector> =
+    std::sync::LazyLock::new(|| static_selector("meta[name=\"description\"]"));
+static SEL_JSON_LD: std::sync::LazyLock<Selector> =
+    std::sync::LazyLock::new(|| static_selector("script[type=\"application/ld+json\"]"));
+static SEL_BODY: std::sync::LazyLock<Selector> =
+    std::sync::LazyLock::new(|| static_selector("body"));
+
+/// OG / Twitter `meta[property=…]` tags and their output labels.
+static SEL_META_PROPERTIES: std::sync::LazyLock<Vec<(Selector, &'static str)>> =
+    std::sync::LazyLock::new(|| {
+        [
+            ("og:title", "OG Title"),
+            ("og:description", "OG Description"),
+            ("og:type", "OG Type"),
+            ("og:published_time", "Published"),
+            ("article:published_time", "Published"),
+            ("article:modified_time", "Modified"),
+        ]
+        .into_iter()
+        .map(|(prop, label)| (static_selector(&format!("meta[property=\"{prop}\"]")), label))
+        .collect()
+    });
+
+/// Published-date carriers, in priority order.
+static SEL_PUBLISHED_DATES: std::sync::LazyLock<Vec<Selector>> =
+    std::sync::LazyLock::new(|| {
+        [
+            "meta[name=\"date\"]",
+            "meta[name=\"pubdate\"]",
+            "meta[name=\"publish_date\"]",
+            "meta[name=\"DC.date.issued\"]",
+            "time[datetime]",
+        ]
+        .into_iter()
+        .map(static_selector)
+        .collect()
+    });
+
+/// Focused content regions tried before falling back to `<body>`.
+static SEL_CONTENT_REGIONS: std::sync::LazyLock<Vec<Selector>> =
+    std::sync::LazyLock::new(|| {
+        [
+            "article", "main", "[role=\"main\"]",
+            ".post-content", ".entry-content", ".article-body",
+            // Weather / data-heavy sites
+            ".forecast", ".current-conditions", ".weather-detail",
+            "#forecast", "#current", ".ten-day", ".daily-forecast",
+            ".region-content-main", ".content-module",
+            "[data-testid=\"forecast\"]",
+            // Generic content wrappers
+            "#content", ".content", "#main-content", ".page-content",
+        ]
+        .into_iter()
+        .map(static_selector)
+        .collect()
+    });
+
 // ═════════════════════════════════════════════════════════════════════════════
 //  BrowsePageTool
 // ═════════════════════════════════════════════════════════════════════════════
@@ -638,119 +710,93 @@ pub(super) fn extract_structured_data(html: &str) -> String {
     let mut parts: Vec<String> = Vec::new();
 
     // Title.
-    if let Ok(sel) = Selector::parse("title") {
-        if let Some(el) = doc.select(&sel).next() {
-            let t: String = el.text().collect();
-            let t = t.trim();
-            if !t.is_empty() && t.len() < 500 {
-                parts.push(format!("Title: {t}"));
-            }
+    if let Some(el) = doc.select(&SEL_TITLE).next() {
+        let t: String = el.text().collect();
+        let t = t.trim();
+        if !t.is_empty() && t.len() < 500 {
+            parts.push(format!("Title: {t}"));
         }
     }
 
     // Meta description.
-    if let Ok(sel) = Selector::parse("meta[name=\"description\"]") {
-        if let Some(el) = doc.select(&sel).next() {
-            if let Some(c) = el.value().attr("content") {
-                let c = c.trim();
-                if !c.is_empty() && c.len() < 500 {
-                    parts.push(format!("Description: {c}"));
-                }
+    if let Some(el) = doc.select(&SEL_META_DESCRIPTION).next() {
+        if let Some(c) = el.value().attr("content") {
+            let c = c.trim();
+            if !c.is_empty() && c.len() < 500 {
+                parts.push(format!("Description: {c}"));
             }
         }
     }
 
     // OG / Twitter meta tags.
-    for (prop, label) in &[
-        ("og:title", "OG Title"),
-        ("og:description", "OG Description"),
-        ("og:type", "OG Type"),
-        ("og:published_time", "Published"),
-        ("article:published_time", "Published"),
-        ("article:modified_time", "Modified"),
-    ] {
-        let selector_str = format!("meta[property=\"{prop}\"]");
-        if let Ok(sel) = Selector::parse(&selector_str) {
-            if let Some(el) = doc.select(&sel).next() {
-                if let Some(c) = el.value().attr("content") {
-                    let c = c.trim();
-                    if !c.is_empty() && c.len() < 500 {
-                        parts.push(format!("{label}: {c}"));
-                    }
+    for (sel, label) in SEL_META_PROPERTIES.iter() {
+        if let Some(el) = doc.select(sel).next() {
+            if let Some(c) = el.value().attr("content") {
+                let c = c.trim();
+                if !c.is_empty() && c.len() < 500 {
+                    parts.push(format!("{label}: {c}"));
                 }
             }
         }
     }
 
     // Published date from various meta tags.
-    for selector_str in &[
-        "meta[name=\"date\"]",
-        "meta[name=\"pubdate\"]",
-        "meta[name=\"publish_date\"]",
-        "meta[name=\"DC.date.issued\"]",
-        "time[datetime]",
-    ] {
-        if let Ok(sel) = Selector::parse(selector_str) {
-            if let Some(el) = doc.select(&sel).next() {
-                let date = el.value().attr("content")
-                    .or_else(|| el.value().attr("datetime"))
-                    .unwrap_or("");
-                if !date.is_empty() && date.len() < 50 {
-                    // Avoid duplicate "Published:" entries.
-                    let already = parts.iter().any(|p| p.starts_with("Published:"));
-                    if !already {
-                        parts.push(format!("Published: {date}"));
-                    }
-                    break;
+    for sel in SEL_PUBLISHED_DATES.iter() {
+        if let Some(el) = doc.select(sel).next() {
+            let date = el.value().attr("content")
+                .or_else(|| el.value().attr("datetime"))
+                .unwrap_or("");
+            if !date.is_empty() && date.len() < 50 {
+                // Avoid duplicate "Published:" entries.
+                let already = parts.iter().any(|p| p.starts_with("Published:"));
+                if !already {
+                    parts.push(format!("Published: {date}"));
                 }
+                break;
             }
         }
     }
 
     // Price-related meta tags.
     let price_keywords = ["price", "amount", "stock", "ticker", "quote"];
-    if let Ok(sel) = Selector::parse("meta") {
-        for el in doc.select(&sel) {
-            let name = el.value().attr("name")
-                .or_else(|| el.value().attr("property"))
-                .unwrap_or("");
-            let content = el.value().attr("content").unwrap_or("");
-            if !content.is_empty() && content.len() < 500 {
-                let name_lower = name.to_ascii_lowercase();
-                let is_price = price_keywords.iter().any(|kw| name_lower.contains(kw));
-                if is_price {
-                    parts.push(format!("meta[{name}]: {content}"));
-                }
+    for el in doc.select(&SEL_META) {
+        let name = el.value().attr("name")
+            .or_else(|| el.value().attr("property"))
+            .unwrap_or("");
+        let content = el.value().attr("content").unwrap_or("");
+        if !content.is_empty() && content.len() < 500 {
+            let name_lower = name.to_ascii_lowercase();
+            let is_price = price_keywords.iter().any(|kw| name_lower.contains(kw));
+            if is_price {
+                parts.push(format!("meta[{name}]: {content}"));
             }
         }
     }
 
     // JSON-LD.
-    if let Ok(sel) = Selector::parse("script[type=\"application/ld+json\"]") {
-        for el in doc.select(&sel).take(3) {
-            let raw: String = el.text().collect();
-            let raw = raw.trim();
-            if raw.len() < 20 {
-                continue;
+    for el in doc.select(&SEL_JSON_LD).take(3) {
+        let raw: String = el.text().collect();
+        let raw = raw.trim();
+        if raw.len() < 20 {
+            continue;
+        }
+        // Try to parse and summarise rather than dumping raw JSON.
+        if let Ok(val) = serde_json::from_str::<serde_json::Value>(raw) {
+            let summary = summarise_ld_json(&val);
+            if !summary.is_empty() {
+                parts.push(format!("JSON-LD: {summary}"));
             }
-            // Try to parse and summarise rather than dumping raw JSON.
-            if let Ok(val) = serde_json::from_str::<serde_json::Value>(raw) {
-                let summary = summarise_ld_json(&val);
-                if !summary.is_empty() {
-                    parts.push(format!("JSON-LD: {summary}"));
-                }
+        } else {
+            // Fallback: include truncated raw JSON.
+            let budget = 1500;
+            if raw.len() > budget {
+                let safe = truncate_byte_boundary(raw, budget);
+                parts.push(format!("JSON-LD: {}…", &raw[..safe]));
             } else {
-                // Fallback: include truncated raw JSON.
-                let budget = 1500;
-                if raw.len() > budget {
-                    let safe = truncate_byte_boundary(raw, budget);
-                    parts.push(format!("JSON-LD: {}…", &raw[..safe]));
-                } else {
-                    parts.push(format!("JSON-LD: {raw}"));
-                }
+                parts.push(format!("JSON-LD: {raw}"));
             }
-            break; // one block is enough
         }
+        break; // one block is enough
     }
 
     parts.join("\n")
@@ -821,33 +867,18 @@ pub(super) fn extract_body_text(html: &str, max_chars: usize) -> String {
     let doc = Html::parse_document(html);
 
     // Try focused content regions first.
-    let selectors = [
-        "article", "main", "[role=\"main\"]",
-        ".post-content", ".entry-content", ".article-body",
-        // Weather / data-heavy sites
-        ".forecast", ".current-conditions", ".weather-detail",
-        "#forecast", "#current", ".ten-day", ".daily-forecast",
-        ".region-content-main", ".content-module",
-        "[data-testid=\"forecast\"]",
-        // Generic content wrappers
-        "#content", ".content", "#main-content", ".page-content",
-    ];
-    for sel_str in &selectors {
-        if let Ok(sel) = Selector::parse(sel_str) {
-            if let Some(el) = doc.select(&sel).next() {
-                let text = extract_text_from_element(&el, max_chars);
-                if text.len() >= 80 {
-                    return text;
-                }
+    for sel in SEL_CONTENT_REGIONS.iter() {
+        if let Some(el) = doc.select(sel).next() {
+            let text = extract_text_from_element(&el, max_chars);
+            if text.len() >= 80 {
+                return text;
             }
         }
     }
 
     // Fall back to body with noise stripped.
-    if let Ok(body_sel) = Selector::parse("body") {
-        if let Some(body) = doc.select(&body_sel).next() {
-            return extract_text_from_element(&body, max_chars);
-        }
+    if let Some(body) = doc.select(&SEL_BODY).next() {
+        return extract_text_from_element(&body, max_chars);
     }
 
     String::new()
@@ -880,17 +911,45 @@ fn extract_text_from_element(el: &scraper::ElementRef<'_>, max_chars: usize) ->
     let mut buf = String::with_capacity(max_chars + 256);
     collect_text(el, &mut buf, skip_tags, skip_classes, block_tags, max_chars);
 
-    // Decode common HTML entities.
-    let decoded = buf
-        .replace("&amp;", "&")
-        .replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&quot;", "\"")
-        .replace("&#39;", "'")
-        .replace("&apos;", "'")
-        .replace("&nbsp;", " ");
-
-    collapse_whitespace(&decoded, max_chars)
+    collapse_whitespace(&decode_html_entities(&buf), max_chars)
+}
+
+/// Decode the common HTML entities in a single left-to-right pass.
+///
+/// Text without `&` is returned borrowed.  Each entity is decoded exactly
+/// once, so `&amp;lt;` yields `&lt;` rather than being decoded twice.
+fn decode_html_entities(text: &str) -> Cow<'_, str> {
+    const ENTITIES: &[(&str, char)] = &[
+        ("&amp;", '&'),
+        ("&lt;", '<'),
+        ("&gt;", '>'),
+        ("&quot;", '"'),
+        ("&#39;", '\''),
+        ("&apos;", '\''),
+        ("&nbsp;", ' '),
+    ];
+
+    if !text.contains('&') {
+        return Cow::Borrowed(text);
+    }
+    let mut out = String::with_capacity(text.len());
+    let mut rest = text;
+    while let Some(amp) = rest.find('&') {
+        out.push_str(&rest[..amp]);
+        let tail = &rest[amp..];
+        match ENTITIES.iter().find(|(entity, _)| tail.starts_with(entity)) {
+            Some((entity, ch)) => {
+                out.push(*ch);
+                rest = &tail[entity.len()..];
+            }
+            None => {
+                out.push('&');
+                rest = &tail[1..];
+            }
+        }
+    }
+    out.push_str(rest);
+    Cow::Owned(out)
 }
 
 fn collect_text(
@@ -1103,6 +1162,16 @@ mod tests {
         assert!(!is_private_url("https://example.com/page"));
     }
 
+    #[test]
+    fn decode_html_entities_single_pass() {
+        assert!(matches!(decode_html_entities("plain text"), Cow::Borrowed(_)));
+        assert_eq!(
+            decode_html_entities("a &amp; b &lt;c&gt; &quot;d&quot; &#39;e&apos;&nbsp;f"),
+            "a & b <c> \"d\" 'e' f"
+        );
+        assert_eq!(decode_html_entities("&amp;lt; & &bogus;"), "&lt; & &bogus;");
+    }
+
     #[test]
     fn extract_structured_data_title() {
         let html = "<html><head><title>Test Page</title></head><body></body></html>";
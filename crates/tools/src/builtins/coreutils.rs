@@ -16,7 +16,9 @@
 //! improved POSIX compliance, then re-format the output through the same
 //! `--aigent-*` pipelines.
 
+use std::borrow::Cow;
 use std::collections::HashMap;
+use std::fmt::Write as _;
 use std::path::{Path, PathBuf, Component};
 
 use anyhow::{Result, bail};
@@ -135,6 +137,32 @@ fn iso_date(st: std::time::SystemTime) -> String {
     dt.to_rfc3339_opts(chrono::SecondsFormat::Secs, true)
 }
 
+/// Escape `s` for use inside a JSON string literal (without the quotes).
+///
+/// Most lines need no escaping, so the input is returned borrowed unless
+/// it contains a quote, backslash or control character.
+fn json_escape(s: &str) -> Cow<'_, str> {
+    let Some(first) = s.bytes().position(|b| b == b'"' || b == b'\\' || b < 0x20) else {
+        return Cow::Borrowed(s);
+    };
+    let mut out = String::with_capacity(s.len() + 8);
+    out.push_str(&s[..first]);
+    for ch in s[first..].chars() {
+        match ch {
+            '"' => out.push_str("\\\""),
+            '\\' => out.push_str("\\\\"),
+            '\n' => out.push_str("\\n"),
+            '\r' => out.push_str("\\r"),
+            '\t' => out.push_str("\\t"),
+            c if (c as u32) < 0x20 => {
+                let _ = write!(out, "\\u{:04x}", c as u32);
+            }
+            c => out.push(c),
+        }
+    }
+    Cow::Owned(out)
+}
+
 // ── list_dir ─────────────────────────────────────────────────────────────────
 
 pub struct ListDirTool {
@@ -209,7 +237,7 @@ impl Tool for ListDirTool {
                     let mod_str = modified.map(iso_date).unwrap_or_default();
                     lines.push(format!(
                         r#"{{"name":"{}{}","type":"{}","size":{},"modified":"{}"}}"#,
-                        name, suffix, kind, size, mod_str
+                        json_escape(name), suffix, kind, size, mod_str
                     ));
                 }
                 OutputMode::Semantic => {
@@ -265,7 +293,7 @@ impl Tool for MkdirTool {
         std::fs::create_dir_all(&full)?;
         let mode = output_mode(args);
         let output = match mode {
-            OutputMode::Jsonl => format!(r#"{{"action":"mkdir","path":"{}","success":true}}"#, rel),
+            OutputMode::Jsonl => format!(r#"{{"action":"mkdir","path":"{}","success":true}}"#, json_escape(rel)),
             OutputMode::Semantic => format!("<mkdir path=\"{}\" success=\"true\"/>", rel),
             OutputMode::Plain => format!("created {}", rel),
         };
@@ -314,7 +342,7 @@ impl Tool for TouchTool {
         }
         let action = if existed { "touched" } else { "created" };
         let output = match mode {
-            OutputMode::Jsonl => format!(r#"{{"action":"{}","path":"{}"}}"#, action, rel),
+            OutputMode::Jsonl => format!(r#"{{"action":"{}","path":"{}"}}"#, action, json_escape(rel)),
             OutputMode::Semantic => format!("<touch action=\"{}\" path=\"{}\"/>", action, rel),
             OutputMode::Plain => format!("{} {}", action, rel),
         };
@@ -399,7 +427,7 @@ impl Tool for RmTool {
         }
 
         let output = match mode {
-            OutputMode::Jsonl => format!(r#"{{"action":"rm","path":"{}","kind":"{}"}}"#, rel, kind),
+            OutputMode::Jsonl => format!(r#"{{"action":"rm","path":"{}","kind":"{}"}}"#, json_escape(rel), kind),
             OutputMode::Semantic => format!("<rm path=\"{}\" kind=\"{}\"/>", rel, kind),
             OutputMode::Plain => {
                 match kind {
@@ -472,7 +500,7 @@ impl Tool for CpTool {
         let output = match mode {
             OutputMode::Jsonl => format!(
                 r#"{{"action":"cp","src":"{}","dst":"{}","recursive":{}}}"#,
-                src_rel, dst_rel, recursive
+                json_escape(src_rel), json_escape(dst_rel), recursive
             ),
             OutputMode::Semantic => format!(
                 "<cp src=\"{}\" dst=\"{}\" recursive=\"{}\"/>",
@@ -543,7 +571,8 @@ impl Tool for MvTool {
 
         let output = match mode {
             OutputMode::Jsonl => format!(
-                r#"{{"action":"mv","src":"{}","dst":"{}"}}"#, src_rel, dst_rel
+                r#"{{"action":"mv","src":"{}","dst":"{}"}}"#,
+                json_escape(src_rel), json_escape(dst_rel)
             ),
             OutputMode::Semantic => format!(
                 "<mv src=\"{}\" dst=\"{}\"/>", src_rel, dst_rel
@@ -652,7 +681,7 @@ impl Tool for FindTool {
                     OutputMode::Jsonl => {
                         let kind = if is_dir { "dir" } else { "file" };
                         results.push(format!(
-                            r#"{{"path":"{}","type":"{}"}}"#, rel_str, kind
+                            r#"{{"path":"{}","type":"{}"}}"#, json_escape(&rel_str), kind
                         ));
                     }
                     OutputMode::Semantic => {
@@ -837,14 +866,10 @@ fn grep_file(
         if re.is_match(line) {
             match mode {
                 OutputMode::Jsonl => {
-                    // Escape the text for JSON.
-                    let escaped = line.replace('\\', "\\\\")
-                        .replace('"', "\\\"")
-                        .replace('\n', "\\n")
-                        .replace('\t', "\\t");
+                    let escaped = json_escape(line);
                     results.push(format!(
                         r#"{{"file":"{}","line":{},"text":"{}"}}"#,
-                        rel.display(), i + 1, escaped
+                        json_escape(&rel.to_string_lossy()), i + 1, escaped
                     ));
                 }
                 OutputMode::Semantic => {
@@ -929,7 +954,7 @@ impl Tool for HeadTool {
                 OutputMode::Jsonl => {
                     let rows: Vec<String> = content.lines().take(n).enumerate()
                         .map(|(i, l)| {
-                            let escaped = l.replace('\\', "\\\\").replace('"', "\\\"");
+                            let escaped = json_escape(l);
                             format!(r#"{{"line":{},"text":"{}"}}"#, i + 1, escaped)
                         })
                         .collect();
@@ -1008,7 +1033,7 @@ impl Tool for TailTool {
             OutputMode::Jsonl => {
                 let rows: Vec<String> = all_lines[start_idx..].iter().enumerate()
                     .map(|(i, l)| {
-                        let escaped = l.replace('\\', "\\\\").replace('"', "\\\"");
+                        let escaped = json_escape(l);
                         format!(r#"{{"line":{},"text":"{}"}}"#, start_idx + i + 1, escaped)
                     })
                     .collect();
@@ -1076,7 +1101,7 @@ impl Tool for WcTool {
         let output = match mode {
             OutputMode::Jsonl => format!(
                 r#"{{"path":"{}","lines":{},"words":{},"chars":{},"bytes":{}}}"#,
-                path, lines, words, chars, bytes
+                json_escape(path), lines, words, chars, bytes
             ),
             OutputMode::Semantic => format!(
                 "<wc path=\"{}\" lines=\"{}\" words=\"{}\" chars=\"{}\" bytes=\"{}\"/>",
@@ -1246,7 +1271,7 @@ fn tree_recurse_jsonl(
         if rows.len() >= max_entries { break; }
         let rel = if rel_prefix.is_empty() { name.clone() } else { format!("{}/{}", rel_prefix, name) };
         let kind = if is_dir { "dir" } else { "file" };
-        rows.push(format!(r#"{{"path":"{}","type":"{}","depth":{}}}"#, rel, kind, depth));
+        rows.push(format!(r#"{{"path":"{}","type":"{}","depth":{}}}"#, json_escape(&rel), kind, depth));
         if is_dir {
             tree_recurse_jsonl(&dir.join(&name), &rel, max_depth, depth + 1, max_entries, rows)?;
         }
@@ -1376,11 +1401,11 @@ impl Tool for WorkspaceStatusTool {
         let output = match mode {
             OutputMode::Jsonl => {
                 let commits_json: Vec<String> = recent_commits.iter()
-                    .map(|c| format!("\"{}\"", c.replace('"', "\\\"")))
+                    .map(|c| format!("\"{}\"", json_escape(c)))
                     .collect();
                 format!(
                     r#"{{"is_git":{},"branch":"{}","changed_files":{},"file_count":{},"total_bytes":{},"recent_commits":[{}]}}"#,
-                    is_git, branch, changed_count, file_count, total_bytes,
+                    is_git, json_escape(&branch), changed_count, file_count, total_bytes,
                     commits_json.join(",")
                 )
             }
@@ -1515,7 +1540,7 @@ impl Tool for SortTool {
             OutputMode::Jsonl => {
                 lines.iter().enumerate()
                     .map(|(i, l)| {
-                        let escaped = l.replace('\\', "\\\\").replace('"', "\\\"");
+                        let escaped = json_escape(l);
                         format!(r#"{{"line":{},"text":"{}"}}"#, i + 1, escaped)
                     })
                     .collect::<Vec<_>>()
@@ -1593,7 +1618,7 @@ impl Tool for UniqTool {
             OutputMode::Jsonl => {
                 result.iter()
                     .map(|(n, l)| {
-                        let escaped = l.replace('\\', "\\\\").replace('"', "\\\"");
+                        let escaped = json_escape(l);
                         format!(r#"{{"count":{},"text":"{}"}}"#, n, escaped)
                     })
                     .collect::<Vec<_>>()
@@ -1673,7 +1698,7 @@ impl Tool for CutTool {
                 let slice: String = chars_vec.iter().skip(start).take(end - start).collect();
                 match mode {
                     OutputMode::Jsonl => {
-                        let escaped = slice.replace('\\', "\\\\").replace('"', "\\\"");
+                        let escaped = json_escape(&slice);
                         result.push(format!(r#"{{"line":{},"text":"{}"}}"#, i + 1, escaped));
                     }
                     OutputMode::Semantic => {
@@ -1698,7 +1723,7 @@ impl Tool for CutTool {
                 match mode {
                     OutputMode::Jsonl => {
                         let vals: Vec<String> = selected.iter()
-                            .map(|s| format!("\"{}\"", s.replace('"', "\\\"")))
+                            .map(|s| format!("\"{}\"", json_escape(s)))
                             .collect();
                         result.push(format!(r#"{{"line":{},"fields":[{}]}}"#, i + 1, vals.join(",")));
                     }
@@ -1776,37 +1801,56 @@ impl Tool for SedTool {
         let full = checked_path(&self.workspace_root, path_str)?;
         let text = std::fs::read_to_string(&full)?;
 
-        let re = regex::Regex::new(pattern)
-            .map_err(|e| anyhow::anyhow!("invalid regex: {}", e))?;
+        // A pattern with no regex metacharacters and a replacement with no
+        // `$` capture references is a plain substring swap — skip compiling
+        // and running a regex for it.
+        let re = if regex::escape(pattern) == *pattern && !replacement.contains('$') {
+            None
+        } else {
+            Some(regex::Regex::new(pattern)
+                .map_err(|e| anyhow::anyhow!("invalid regex: {}", e))?)
+        };
 
+        let mut matched = 0usize;
         let mut changes = 0usize;
-        let result: String = text
-            .lines()
-            .map(|line| {
-                let replaced = if global {
-                    re.replace_all(line, replacement.as_str()).to_string()
-                } else {
-                    re.replace(line, replacement.as_str()).to_string()
-                };
-                if replaced != line { changes += 1; }
-                replaced
-            })
-            .collect::<Vec<_>>()
-            .join("\n");
+        let mut result = String::with_capacity(text.len());
+        for (i, line) in text.lines().enumerate() {
+            let found = match &re {
+                Some(re) => re.is_match(line),
+                None => line.contains(pattern.as_str()),
+            };
+            let replaced: Cow<'_, str> = match &re {
+                _ if !found => Cow::Borrowed(line),
+                Some(re) if global => re.replace_all(line, replacement.as_str()),
+                Some(re) => re.replace(line, replacement.as_str()),
+                None if global => Cow::Owned(line.replace(pattern.as_str(), replacement)),
+                None => Cow::Owned(line.replacen(pattern.as_str(), replacement, 1)),
+            };
+            if found { matched += 1; }
+            if replaced != line { changes += 1; }
+            if i > 0 { result.push('\n'); }
+            result.push_str(&replaced);
+        }
 
-        if in_place {
+        if in_place && changes > 0 {
             std::fs::write(&full, &result)?;
         }
 
         let output = match mode {
             OutputMode::Jsonl => format!(
                 r#"{{"path":"{}","changes":{},"in_place":{}}}"#,
-                path_str, changes, in_place
+                json_escape(path_str), changes, in_place
             ),
             OutputMode::Semantic => format!(
                 "<sed path=\"{}\" changes=\"{}\" in_place=\"{}\"/>",
                 path_str, changes, in_place
             ),
+            // Like sed itself, a pattern that matches nothing is not a
+            // failure, but say so instead of echoing the file unchanged as
+            // if the edit had been applied.
+            OutputMode::Plain if matched == 0 => format!(
+                "pattern {pattern:?} not found in {path_str}; changes: 0, file unchanged"
+            ),
             OutputMode::Plain => result,
         };
         Ok(ToolOutput { output, success: true })
@@ -1874,8 +1918,8 @@ impl Tool for EchoTool {
 
         let output = match mode {
             OutputMode::Jsonl => {
-                let escaped = text.replace('\\', "\\\\").replace('"', "\\\"").replace('\n', "\\n");
-                let file_str = file.as_deref().unwrap_or("");
+                let escaped = json_escape(&text);
+                let file_str = json_escape(file.as_deref().unwrap_or(""));
                 format!(r#"{{"text":"{}","file":"{}","append":{}}}"#, escaped, file_str, append)
             }
             OutputMode::Semantic => {
@@ -1985,7 +2029,8 @@ fn run_uutils_head(path: &Path, n: usize) -> Result<String> {
     if !output.status.success() {
         bail!("head failed: {}", String::from_utf8_lossy(&output.stderr));
     }
-    Ok(String::from_utf8_lossy(&output.stdout).to_string())
+    Ok(String::from_utf8(output.stdout)
+        .unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned()))
 }
 
 /// Format head/tail output in the requested mode.
@@ -1997,7 +2042,7 @@ fn format_line_output(raw: &str, _path: &str, _n: usize, _is_head: bool, mode: O
         OutputMode::Jsonl => {
             let rows: Vec<String> = all_lines.iter().enumerate()
                 .map(|(i, l)| {
-                    let escaped = l.replace('\\', "\\\\").replace('"', "\\\"");
+                    let escaped = json_escape(l);
                     format!(r#"{{"line":{},"text":"{}"}}"#, i + 1, escaped)
                 })
                 .collect();
@@ -2420,4 +2465,75 @@ mod tests {
 
         let _ = std::fs::remove_dir_all(&tmp);
     }
+
+    /// Run sed over a fixed file; returns the tool output and the file's
+    /// contents afterwards.
+    async fn run_sed(
+        dir: &str,
+        pattern: &str,
+        replacement: &str,
+        global: bool,
+        in_place: bool,
+    ) -> (ToolOutput, String) {
+        let tmp = std::env::temp_dir().join(dir);
+        let _ = std::fs::remove_dir_all(&tmp);
+        std::fs::create_dir_all(&tmp).unwrap();
+        // The trailing newline is dropped by a rewrite, so it shows whether
+        // an in-place run wrote the file.
+        std::fs::write(tmp.join("f.txt"), "a.b a.b\nnone\naxb\n").unwrap();
+
+        let tool = SedTool { workspace_root: tmp.clone() };
+        let mut args = HashMap::new();
+        args.insert("path".into(), "f.txt".into());
+        args.insert("pattern".into(), pattern.into());
+        args.insert("replacement".into(), replacement.into());
+        args.insert("global".into(), global.to_string());
+        args.insert("in_place".into(), in_place.to_string());
+        let out = tool.run(&args).await.unwrap();
+        let after = std::fs::read_to_string(tmp.join("f.txt")).unwrap();
+        let _ = std::fs::remove_dir_all(&tmp);
+        (out, after)
+    }
+
+    #[test]
+    fn json_escape_borrows_clean_text() {
+        assert!(matches!(json_escape("plain line"), Cow::Borrowed(_)));
+        assert_eq!(json_escape("a\"b\\c\td\u{1}"), "a\\\"b\\\\c\\td\\u0001");
+        let row = format!(r#"{{"text":"{}"}}"#, json_escape("say \"hi\"\tC:\\x"));
+        let parsed: serde_json::Value = serde_json::from_str(&row).unwrap();
+        assert_eq!(parsed["text"], "say \"hi\"\tC:\\x");
+    }
+
+    #[tokio::test]
+    async fn sed_literal_pattern() {
+        // No metacharacters: plain substring replacement.
+        let (out, _) = run_sed("aigent_test_sed_literal", "none", "some", true, false).await;
+        assert_eq!(out.output, "a.b a.b\nsome\naxb");
+    }
+
+    #[tokio::test]
+    async fn sed_regex_pattern_and_first_only() {
+        // `.` is a metacharacter, so this still goes through the regex engine.
+        let (out, _) = run_sed("aigent_test_sed_regex", "a.b", "X", false, false).await;
+        assert_eq!(out.output, "X a.b\nnone\nX");
+        let (out, _) = run_sed("aigent_test_sed_capture", "(n)one", "${1}ine", true, false).await;
+        assert_eq!(out.output, "a.b a.b\nnine\naxb");
+    }
+
+    #[tokio::test]
+    async fn sed_no_match_reports_miss_without_writing() {
+        let (out, after) = run_sed("aigent_test_sed_no_match", "gamma", "delta", true, true).await;
+        assert!(out.success);
+        assert!(out.output.contains("not found"));
+        assert!(out.output.contains("changes: 0"));
+        assert_eq!(after, "a.b a.b\nnone\naxb\n");
+    }
+
+    #[tokio::test]
+    async fn sed_identical_replacement_is_not_a_miss() {
+        let (out, after) = run_sed("aigent_test_sed_identical", "(none)", "$1", true, true).await;
+        assert!(out.success);
+        assert_eq!(out.output, "a.b a.b\nnone\naxb");
+        assert_eq!(after, "a.b a.b\nnone\naxb\n");
+    }
 }
@@ -1,6 +1,7 @@
 //! Shell execution tool.
 
 use std::collections::HashMap;
+use std::fmt::Write as _;
 use std::path::PathBuf;
 
 use anyhow::Result;
@@ -86,28 +87,26 @@ impl Tool for RunShellTool {
         .await
         .map_err(|_| anyhow::anyhow!("command timed out after {}s", timeout_secs))??;
 
-        let stdout = String::from_utf8_lossy(&output.stdout);
-        let stderr = String::from_utf8_lossy(&output.stderr);
-        let combined = if stderr.is_empty() {
-            stdout.to_string()
-        } else {
-            format!("{stdout}\n[stderr] {stderr}")
-        };
+        // Take ownership of stdout: valid UTF-8 (the common case) becomes the
+        // output String without a copy; only invalid bytes go the lossy route.
+        let mut combined = String::from_utf8(output.stdout)
+            .unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned());
+        if !output.stderr.is_empty() {
+            combined.push_str("\n[stderr] ");
+            combined.push_str(&String::from_utf8_lossy(&output.stderr));
+        }
 
         // Truncate output to prevent context explosion
-        let result = if combined.len() > self.max_output_bytes {
-            format!(
-                "{}…[truncated at {} bytes]",
-                &combined[..self.max_output_bytes],
-                self.max_output_bytes
-            )
-        } else {
-            combined
-        };
+        if combined.len() > self.max_output_bytes {
+            let mut end = self.max_output_bytes;
+            while !combined.is_char_boundary(end) { end -= 1; }
+            combined.truncate(end);
+            let _ = write!(combined, "…[truncated at {} bytes]", self.max_output_bytes);
+        }
 
         Ok(ToolOutput {
             success: output.status.success(),
-            output: result,
+            output: combined,
         })
     }
 }
@@ -14,7 +14,7 @@ use percent_encoding::percent_decode_str;
 use scraper::{Html, Selector};
 
 use crate::{Tool, ToolSpec, ToolParam, ToolOutput, ToolMetadata, SecurityLevel};
-use super::browse::{build_client, extract_body_text as html_to_text, extract_structured_data};
+use super::browse::{build_client, extract_body_text as html_to_text, extract_structured_data, static_selector};
 use super::fs::truncate_byte_boundary;
 use super::cache::TtlCache;
 
@@ -32,6 +32,14 @@ const CACHE_MAX_ENTRIES: usize = 64;
 static SEARCH_CACHE: std::sync::LazyLock<TtlCache> =
     std::sync::LazyLock::new(|| TtlCache::new(CACHE_MAX_ENTRIES, CACHE_TTL));
 
+/// DuckDuckGo HTML result selectors, parsed once.
+static DDG_RESULT_SEL: std::sync::LazyLock<Selector> =
+    std::sync::LazyLock::new(|| static_selector(".result"));
+static DDG_LINK_SEL: std::sync::LazyLock<Selector> =
+    std::sync::LazyLock::new(|| static_selector("a.result__a"));
+static DDG_SNIPPET_SEL: std::sync::LazyLock<Selector> =
+    std::sync::LazyLock::new(|| static_selector("a.result__snippet, .result__snippet"));
+
 /// Cache key: combine query + max_results for uniqueness.
 fn cache_key(query: &str, max_results: usize) -> String {
     format!("search:{}:{}", query.to_lowercase().trim(), max_results)
@@ -352,22 +360,18 @@ async fn search_duckduckgo(
     let (parts, urls) = {
         let doc = Html::parse_document(&body);
 
-        let result_sel = Selector::parse(".result").unwrap();
-        let link_sel = Selector::parse("a.result__a").unwrap();
-        let snippet_sel = Selector::parse("a.result__snippet, .result__snippet").unwrap();
-
         let mut parts: Vec<String> = Vec::new();
         let mut urls: Vec<String> = Vec::new();
-        for result in doc.select(&result_sel).take(max_results) {
+        for result in doc.select(&DDG_RESULT_SEL).take(max_results) {
             let title = result
-                .select(&link_sel)
+                .select(&DDG_LINK_SEL)
                 .next()
                 .map(|el| el.text().collect::<String>())
                 .unwrap_or_default();
             let title = title.trim();
 
             let url = result
-                .select(&link_sel)
+                .select(&DDG_LINK_SEL)
                 .next()
                 .and_then(|el| el.value().attr("href"))
                 .unwrap_or("");
@@ -375,7 +379,7 @@ async fn search_duckduckgo(
             let url = extract_ddg_url(url);
 
             let snippet = result
-                .select(&snippet_sel)
+                .select(&DDG_SNIPPET_SEL)
                 .next()
                 .map(|el| el.text().collect::<String>())
                 .unwrap_or_default();